@@ -33,14 +33,46 @@ else
   sed_args="-i"
 fi
 
-sed ${sed_args} "s|/tools/host|${TOOLS_PATH}/host|g" ${TOOLS_PATH}/host/share/autoconf/autom4te.cfg
+# Incremental builds reuse the tools directory, which may have been rewritten
+# already.
+if ! grep -q "${TOOLS_PATH}/host" ${TOOLS_PATH}/host/share/autoconf/autom4te.cfg; then
+    sed ${sed_args} "s|/tools/host|${TOOLS_PATH}/host|g" ${TOOLS_PATH}/host/share/autoconf/autom4te.cfg
+fi
 
 # We force linking of external static libraries by removing the shared
 # libraries. This is hacky. But we're building in a temporary container
 # and it gets the job done.
 find ${TOOLS_PATH}/deps -name '*.so*' -exec rm {} \;
 
-tar -xf Python-${PYTHON_VERSION}.tar.xz
+# Incremental builds (CPYTHON_INCREMENTAL) run in a build directory persisting
+# across builds. Configure results are cached as long as the build environment
+# is unchanged (CPYTHON_CONFIGURE_STAMP). The patched and configured source tree
+# is reused as long as the source archive and patches are unchanged as well
+# (CPYTHON_SOURCE_STAMP), so make only rebuilds what changed since the last build.
+if [ -n "${CPYTHON_INCREMENTAL}" ]; then
+    if [ "$(cat configure.stamp 2>/dev/null)" != "${CPYTHON_CONFIGURE_STAMP}" ]; then
+        rm -f config.cache
+        echo "${CPYTHON_CONFIGURE_STAMP}" > configure.stamp
+    fi
+
+    if [[ -f Python-${PYTHON_VERSION}/Makefile && "$(cat source.stamp 2>/dev/null)" = "${CPYTHON_SOURCE_STAMP}" ]]; then
+        REUSE_SOURCE=1
+    fi
+
+    rm -rf out pip-tmp
+fi
+
+# With --python-source, the source directory is copied to python-source
+# instead of providing an archive.
+if [ -z "${REUSE_SOURCE}" ]; then
+    rm -rf Python-${PYTHON_VERSION} source.stamp
+    if [ -d python-source ]; then
+        mv python-source Python-${PYTHON_VERSION}
+    else
+        tar -xf Python-${PYTHON_VERSION}.tar.xz
+    fi
+fi
+rm -rf python-source
 
 PIP_WHEEL="${ROOT}/pip-${PIP_VERSION}-py3-none-any.whl"
 SETUPTOOLS_WHEEL="${ROOT}/setuptools-${SETUPTOOLS_VERSION}-py3-none-any.whl"
@@ -63,12 +95,20 @@ popd
 rm -rf pip-tmp
 
 cat Setup.local
-mv Setup.local Python-${PYTHON_VERSION}/Modules/Setup.local
+if cmp -s Setup.local Python-${PYTHON_VERSION}/Modules/Setup.local; then
+    # Don't make a reused source tree look modified.
+    rm Setup.local
+else
+    mv Setup.local Python-${PYTHON_VERSION}/Modules/Setup.local
+fi
 
 cat Makefile.extra
 
 pushd Python-${PYTHON_VERSION}
 
+# Patches the source tree and regenerates configure. A reused source tree
+# has already been patched and configured, so this is skipped for it.
+patch_source() {
 # configure doesn't support cross-compiling on Apple. Teach it.
 if [ "${PYTHON_MAJMIN_VERSION}" = "3.13" ]; then
     patch -p1 -i ${ROOT}/patch-apple-cross-3.13.patch
@@ -275,6 +315,11 @@ autoconf
 if [ -n "${CROSS_COMPILING}" ]; then
   patch -p1 -i ${ROOT}/patch-force-cross-compile.patch
 fi
+}
+
+if [ -z "${REUSE_SOURCE}" ]; then
+    patch_source
+fi
 
 # Most bits look at CFLAGS. But setup.py only looks at CPPFLAGS.
 # So we need to set both.
@@ -349,6 +394,10 @@ if [ "${CC}" = "musl-clang" ]; then
     # place.
     for h in /tools/${TOOLCHAIN}/lib/clang/*/include/*intrin.h /tools/${TOOLCHAIN}/lib/clang/*/include/{__wmmintrin_aes.h,__wmmintrin_pclmul.h,mm_malloc.h}; do
         filename=$(basename "$h")
+        # Incremental builds reuse the tools directory of a previous build.
+        if [[ -n "${CPYTHON_INCREMENTAL}" ]] && cmp -s "$h" "/tools/host/include/${filename}"; then
+            continue
+        fi
         if [ -e "/tools/host/include/${filename}" ]; then
             echo "${filename} already exists; don't need to copy!"
             exit 1
@@ -491,11 +540,37 @@ if [ -n "${CROSS_COMPILING}" ]; then
     fi
 fi
 
-CFLAGS=$CFLAGS CPPFLAGS=$CFLAGS LDFLAGS=$LDFLAGS \
-    ./configure ${CONFIGURE_FLAGS}
+if [ -n "${CPYTHON_INCREMENTAL}" ]; then
+    CONFIGURE_FLAGS="${CONFIGURE_FLAGS} --cache-file=${ROOT}/config.cache"
+fi
+
+if [ -n "${REUSE_SOURCE}" ]; then
+    # Regenerates the Makefile if Setup.local changed.
+    make Makefile
+else
+    CFLAGS=$CFLAGS CPPFLAGS=$CFLAGS LDFLAGS=$LDFLAGS \
+        ./configure ${CONFIGURE_FLAGS}
+fi
+
+# Supplement produced Makefile with our modifications. Incremental builds
+# delimit them so they can be replaced when Makefile.extra changes. The
+# Makefile is only replaced if its content changed so make doesn't consider
+# targets depending on it out of date.
+if [ -n "${CPYTHON_INCREMENTAL}" ]; then
+    sed '/^# Makefile.extra$/,$d' Makefile > Makefile.new
+    echo '# Makefile.extra' >> Makefile.new
+    cat ../Makefile.extra >> Makefile.new
+
+    if cmp -s Makefile.new Makefile; then
+        rm Makefile.new
+    else
+        mv Makefile.new Makefile
+    fi
 
-# Supplement produced Makefile with our modifications.
-cat ../Makefile.extra >> Makefile
+    echo "${CPYTHON_SOURCE_STAMP}" > ${ROOT}/source.stamp
+else
+    cat ../Makefile.extra >> Makefile
+fi
 
 make -j ${NUM_CPUS}
 make -j ${NUM_CPUS} sharedinstall DESTDIR=${ROOT}/out/python
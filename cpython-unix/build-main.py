@@ -4,17 +4,23 @@
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 import argparse
-import multiprocessing
+import itertools
 import os
 import pathlib
 import platform
+import shlex
 import subprocess
 import sys
 
 from pythonbuild.downloads import DOWNLOADS
+from pythonbuild.logging import set_tracer, timed
 from pythonbuild.utils import (
+    COMPRESSION_PROFILES,
+    build_parallelism,
     compress_python_archive,
     get_target_settings,
+    host_llvm_strip,
+    print_parallelism_report,
     release_tag_from_git,
     supported_targets,
 )
@@ -48,20 +54,23 @@ def main():
 
     parser.add_argument(
         "--target-triple",
-        default=default_target_triple,
+        nargs="+",
+        default=[default_target_triple],
         choices=supported_targets(TARGETS_CONFIG),
-        help="Target host triple to build for",
+        help="Target host triple(s) to build for",
     )
 
     optimizations = {"debug", "noopt", "pgo", "lto", "pgo+lto"}
     parser.add_argument(
         "--options",
+        nargs="+",
         choices=optimizations.union({f"freethreaded+{o}" for o in optimizations}),
-        default="noopt",
+        default=["noopt"],
         help="Build options to apply when compiling Python",
     )
     parser.add_argument(
         "--python",
+        nargs="+",
         choices={
             "cpython-3.9",
             "cpython-3.10",
@@ -69,8 +78,8 @@ def main():
             "cpython-3.12",
             "cpython-3.13",
         },
-        default="cpython-3.11",
-        help="Python distribution to build",
+        default=["cpython-3.11"],
+        help="Python distribution(s) to build",
     )
     parser.add_argument(
         "--python-source",
@@ -88,16 +97,56 @@ def main():
         default=True if sys.platform == "darwin" else False,
         help="Disable building in Docker",
     )
+    parser.add_argument(
+        "--docker-bind-mount",
+        action="store_true",
+        help="Bind mount the build directory into build containers instead of "
+        "copying inputs into them (requires a local Docker daemon)",
+    )
+    parser.add_argument(
+        "--container-pool",
+        action="store_true",
+        help="Reuse warm Docker containers between build steps",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse a persistent CPython build directory to only rebuild what "
+        "changed (for development)",
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=("quiet", "progress", "verbose"),
+        default="verbose",
+        help="What to print to the console: nothing but failures, progress "
+        "messages, or also the output of build commands",
+    )
+    parser.add_argument(
+        "--compress-logs",
+        action="store_true",
+        help="zstd compress the logs written to build/logs",
+    )
     parser.add_argument(
         "--serial",
         action="store_true",
         help="Build packages serially, without parallelism",
     )
+    parser.add_argument(
+        "--prefetch",
+        action="store_true",
+        help="Download all source archives concurrently before building",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Fail instead of downloading anything not in the local cache or mirrors",
+    )
     parser.add_argument(
         "--make-target",
         choices={
             "default",
             "empty",
+            "prefetch",
             "toolchain",
             "toolchain-image-build",
             "toolchain-image-build.cross",
@@ -109,20 +158,128 @@ def main():
         help="The make target to evaluate",
     )
 
+    parser.add_argument(
+        "--compression-profile",
+        choices=COMPRESSION_PROFILES.keys(),
+        default="release",
+        help="zstd settings to compress the distribution archive with",
+    )
+    parser.add_argument(
+        "--install-only",
+        action="store_true",
+        help="Also produce the install_only and install_only_stripped archives "
+        "while compressing",
+    )
+    parser.add_argument(
+        "--llvm-strip",
+        help="Path to the llvm-strip producing the install_only_stripped archive "
+        "(defaults to the one of the host's LLVM toolchain)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Number of concurrent package builds (derived from CPUs and memory by default)",
+    )
+
     args = parser.parse_args()
 
-    target_triple = args.target_triple
+    if args.llvm_strip and not args.install_only:
+        print("--llvm-strip requires --install-only")
+        return 1
+
+    # install_only archive names don't include the build options, so variants
+    # differing in them would write the same archives.
+    if args.install_only and len(set(args.options)) > 1:
+        print("--install-only can only be used with a single --options value")
+        return 1
+
+    if "PYBUILD_RELEASE_TAG" in os.environ:
+        release_tag = os.environ["PYBUILD_RELEASE_TAG"]
+    else:
+        release_tag = release_tag_from_git()
+
+    variants = list(
+        itertools.product(
+            sorted(set(args.python)),
+            sorted(set(args.target_triple)),
+            sorted(set(args.options)),
+        )
+    )
+
+    if len(variants) > 1:
+        if args.python_source:
+            print("--python-source can only be used when building a single Python")
+            return 1
+
+        return build_matrix(args, host_platform, variants, release_tag)
+
+    python, target_triple, options = variants[0]
+
+    res = variant_environment(
+        args, host_platform, python, target_triple, options, release_tag
+    )
+    if res is None:
+        return 1
+
+    env, build_basename, dist_basename = res
+
+    # Builds of individual packages don't share a make jobserver with the
+    # outer make. So we size the number of concurrent package builds and the
+    # make parallelism within each from the available cores and memory to
+    # avoid oversaturating the machine. The Makefile lists the long tcl -> tk
+    # -> tix chain first so make starts it as early as possible.
+    parallelism = build_parallelism(serial=args.serial)
+    print_parallelism_report(parallelism)
+
+    env["PYBUILD_INNER_JOBS"] = "%d" % parallelism["inner"]
+    env["PYBUILD_CPYTHON_JOBS"] = "%d" % parallelism["cpython"]
+    env["PYBUILD_TRACE"] = start_trace()
 
+    if args.prefetch and args.make_target != "prefetch":
+        subprocess.run(["make", "prefetch"], env=env, check=True)
+
+    subprocess.run(
+        ["make", "-j%d" % (args.jobs or parallelism["outer"]), args.make_target],
+        env=env,
+        check=True,
+    )
+
+    DIST.mkdir(exist_ok=True)
+
+    if args.make_target == "default":
+        # The host toolchain is only obtained once there is an archive to strip.
+        llvm_strip = args.llvm_strip
+        if args.install_only and not llvm_strip:
+            llvm_strip = str(host_llvm_strip(host_platform, target_triple, BUILD))
+
+        with timed("compress_python_archive", category="action"):
+            compress_python_archive(
+                BUILD / build_basename,
+                DIST,
+                dist_basename,
+                profile=args.compression_profile,
+                install_only=args.install_only,
+                llvm_strip=llvm_strip,
+            )
+
+
+def variant_environment(
+    args, host_platform, python, target_triple, options, release_tag
+):
+    """Resolve the make environment and archive names of a build variant.
+
+    Returns None if the variant can't be built.
+    """
     settings = get_target_settings(TARGETS_CONFIG, target_triple)
 
     supported_pythons = {"cpython-%s" % p for p in settings["pythons_supported"]}
 
-    if args.python not in supported_pythons:
+    if python not in supported_pythons:
         print(
             "%s only supports following Pythons: %s"
             % (target_triple, ", ".join(supported_pythons))
         )
-        return 1
+        return None
 
     python_source = (
         (str(pathlib.Path(args.python_source).resolve()))
@@ -136,7 +293,7 @@ def main():
 
     env["PYBUILD_HOST_PLATFORM"] = host_platform
     env["PYBUILD_TARGET_TRIPLE"] = target_triple
-    env["PYBUILD_BUILD_OPTIONS"] = args.options
+    env["PYBUILD_BUILD_OPTIONS"] = options
     env["PYBUILD_PYTHON_SOURCE"] = python_source
     if musl:
         env["PYBUILD_MUSL"] = "1"
@@ -144,58 +301,187 @@ def main():
         env["PYBUILD_BREAK_ON_FAILURE"] = "1"
     if args.no_docker:
         env["PYBUILD_NO_DOCKER"] = "1"
+    if args.docker_bind_mount:
+        env["PYBUILD_DOCKER_BIND_MOUNT"] = str(BUILD)
+    if args.container_pool:
+        env["PYBUILD_CONTAINER_POOL"] = str(BUILD / "container-pool")
+    if args.incremental:
+        env["PYBUILD_INCREMENTAL"] = str(BUILD / "incremental")
+    if args.offline:
+        env["PYBUILD_OFFLINE"] = "1"
+    env["PYBUILD_LOG_LEVEL"] = args.log_level
+    if args.compress_logs:
+        env["PYBUILD_COMPRESS_LOGS"] = "1"
 
     if not args.python_source:
-        entry = DOWNLOADS[args.python]
+        entry = DOWNLOADS[python]
         env["PYBUILD_PYTHON_VERSION"] = cpython_version = entry["version"]
     else:
         # TODO consider parsing version from source checkout. Or defining version
         # from CLI argument.
         if "PYBUILD_PYTHON_VERSION" not in env:
             print("PYBUILD_PYTHON_VERSION must be set when using `--python-source`")
-            return 1
+            return None
         cpython_version = env["PYBUILD_PYTHON_VERSION"]
 
     python_majmin = ".".join(cpython_version.split(".")[0:2])
 
-    if "PYBUILD_RELEASE_TAG" in os.environ:
-        release_tag = os.environ["PYBUILD_RELEASE_TAG"]
-    else:
-        release_tag = release_tag_from_git()
-
     # Guard against accidental misuse of the free-threaded flag with older versions
-    if "freethreaded" in args.options and python_majmin not in ("3.13",):
+    if "freethreaded" in options and python_majmin not in ("3.13",):
         print(
             "Invalid build option: 'freethreaded' is only compatible with CPython 3.13+ (got %s)"
             % cpython_version
         )
-        return 1
+        return None
 
     archive_components = [
         "cpython-%s" % cpython_version,
         target_triple,
-        args.options,
+        options,
     ]
 
     build_basename = "-".join(archive_components) + ".tar"
     dist_basename = "-".join(archive_components + [release_tag])
 
-    # We run make with static parallelism no greater than the machine's CPU count
-    # because we can get some speedup from parallel operations. But we also don't
-    # share a make job server with each build. So if we didn't limit the
-    # parallelism we could easily oversaturate the CPU. Higher levels of
-    # parallelism don't result in meaningful build speedups because tk/tix has
-    # a long, serial dependency chain that can't be built in parallel.
-    parallelism = min(1 if args.serial else 4, multiprocessing.cpu_count())
+    return env, build_basename, dist_basename
+
+
+def build_matrix(args, host_platform, variants, release_tag):
+    """Build multiple variants with a single global job budget.
+
+    We write out a makefile with a target per variant that invokes the
+    regular Makefile recursively. All sub-makes share the top-level make's
+    jobserver, so the union of all variants' dependency graphs is scheduled
+    within one budget. Concurrent attempts to produce a shared artifact (e.g.
+    dependencies shared between build options or toolchains shared between
+    targets) are serialized by ``build.py``.
+    """
+    lines = []
+    targets = []
+
+    for python, target_triple, options in variants:
+        res = variant_environment(
+            args, host_platform, python, target_triple, options, release_tag
+        )
+        if res is None:
+            print("skipping %s %s %s" % (python, target_triple, options))
+            continue
+
+        env, build_basename, dist_basename = res
+
+        name = "%s-%s-%s" % (python, target_triple, options)
+        targets.append(name)
+
+        if args.prefetch and args.make_target != "prefetch":
+            subprocess.run(["make", "prefetch"], env=env, check=True)
+
+        variables = " ".join(
+            "%s=%s" % (k, make_quote(v))
+            for k, v in sorted(env.items())
+            if k.startswith("PYBUILD_")
+        )
+
+        lines.append("%s:\n" % name)
+        lines.append(
+            "\t+cd %s && %s $(MAKE) %s\n"
+            % (make_quote(str(SUPPORT)), variables, args.make_target)
+        )
+
+        if args.make_target == "default":
+            # Like in single variant builds, the host's llvm-strip is only
+            # obtained once the build succeeded.
+            if args.install_only:
+                install_only_args = " ".join(
+                    make_quote(a)
+                    for a in (
+                        args.llvm_strip or "",
+                        host_platform,
+                        target_triple,
+                        str(BUILD),
+                    )
+                )
+            else:
+                install_only_args = ""
+
+            lines.append(
+                "\t%s -c %s %s %s %s %s\n"
+                % (
+                    make_quote(sys.executable),
+                    # Timed like in single variant builds. As a one-liner,
+                    # timed() is applied as a decorator.
+                    make_quote(
+                        "import os, pathlib, sys; "
+                        "from pythonbuild.logging import set_tracer, timed; "
+                        "from pythonbuild.utils import "
+                        "compress_python_archive, host_llvm_strip; "
+                        'set_tracer(os.environ.get("PYBUILD_TRACE"), "build-main"); '
+                        "install_only = len(sys.argv) > 4; "
+                        "llvm_strip = install_only and (sys.argv[4] or "
+                        "str(host_llvm_strip(sys.argv[5], sys.argv[6], "
+                        "pathlib.Path(sys.argv[7])))); "
+                        'timed("compress_python_archive", category="action")('
+                        "compress_python_archive)(pathlib.Path(sys.argv[1]), "
+                        "pathlib.Path(sys.argv[2]), sys.argv[3], "
+                        "install_only=install_only, llvm_strip=llvm_strip or None)"
+                    ),
+                    make_quote(str(BUILD / build_basename)),
+                    make_quote(str(DIST)),
+                    make_quote(dist_basename),
+                    install_only_args,
+                )
+            )
+
+    if not targets:
+        print("no buildable variants")
+        return 1
+
+    BUILD.mkdir(exist_ok=True)
+    DIST.mkdir(exist_ok=True)
+
+    makefile_path = BUILD / "Makefile.matrix"
+    with makefile_path.open("w") as fh:
+        fh.write(".PHONY: all %s\n" % " ".join(targets))
+        fh.write("all: %s\n" % " ".join(targets))
+        fh.write("".join(lines))
+
+    parallelism = build_parallelism(variants=len(targets), serial=args.serial)
+    print_parallelism_report(parallelism)
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(ROOT)
+    env["PYBUILD_INNER_JOBS"] = "%d" % parallelism["inner"]
+    env["PYBUILD_CPYTHON_JOBS"] = "%d" % parallelism["cpython"]
+    env["PYBUILD_TRACE"] = start_trace()
+    env["PYBUILD_COMPRESSION_PROFILE"] = args.compression_profile
+
+    jobs = args.jobs or parallelism["outer"]
+
+    print("building %d variants with %d jobs" % (len(targets), jobs))
 
     subprocess.run(
-        ["make", "-j%d" % parallelism, args.make_target], env=env, check=True
+        ["make", "-j%d" % jobs, "-f", str(makefile_path), "all"], env=env, check=True
     )
 
-    DIST.mkdir(exist_ok=True)
 
-    if args.make_target == "default":
-        compress_python_archive(BUILD / build_basename, DIST, dist_basename)
+def start_trace():
+    """Start a new trace file recording the timings of build steps.
+
+    Run ``just critical-path`` afterwards to see what the build waited on.
+    """
+    BUILD.mkdir(exist_ok=True)
+
+    trace_path = BUILD / "trace.json"
+    with trace_path.open("w", encoding="utf-8") as fh:
+        fh.write("[\n")
+
+    set_tracer(str(trace_path), "build-main")
+
+    return str(trace_path)
+
+
+def make_quote(s):
+    """Quote a string for use in a shell command in a makefile recipe."""
+    return shlex.quote(s).replace("$", "$$")
 
 
 if __name__ == "__main__":
@@ -4,6 +4,7 @@
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 import argparse
+import contextlib
 import json
 import os
 import pathlib
@@ -16,7 +17,14 @@ import tempfile
 import docker
 import zstandard
 
-from pythonbuild.buildenv import build_environment
+from pythonbuild.buildenv import (
+    artifact_archive_path,
+    build_environment,
+    incremental_build_path,
+    persistent_build_environment,
+    toolchain_archive_path,
+    toolchain_packages,
+)
 from pythonbuild.cpython import (
     STDLIB_TEST_PACKAGES,
     derive_setup_local,
@@ -24,18 +32,36 @@ from pythonbuild.cpython import (
     meets_python_maximum_version,
     meets_python_minimum_version,
     parse_setup_line,
+    setup_source_path,
 )
 from pythonbuild.docker import build_docker_image, get_image, write_dockerfiles
 from pythonbuild.downloads import DOWNLOADS
-from pythonbuild.logging import log, set_logger
+from pythonbuild.logging import (
+    VERBOSITY_LEVELS,
+    log,
+    log_to_file,
+    set_tracer,
+    timed,
+)
 from pythonbuild.utils import (
+    DEPENDENCY_BUILD_OPTIONS,
+    IntegrityIndex,
     add_env_common,
     add_licenses_to_extension_entry,
+    artifact_cache_get,
+    artifact_cache_key,
+    artifact_cache_put,
+    artifact_cache_root,
     clang_toolchain,
-    create_tar_from_directory,
     download_entry,
+    exclusive_lock,
     get_target_settings,
     get_targets,
+    hash_path_indexed,
+    package_extra_archives,
+    prefetch_downloads,
+    tar_members_from_directory,
+    target_downloads,
     target_needs,
     validate_python_json,
     write_cpython_version,
@@ -222,16 +248,94 @@ def add_target_env(env, build_platform, target_triple, build_env):
     env["EXTRA_TARGET_LDFLAGS"] = " ".join(extra_target_ldflags)
 
 
-def toolchain_archive_path(package_name, host_platform):
-    entry = DOWNLOADS[package_name]
+def install_binutils(platform):
+    return platform != "macos"
 
-    basename = "%s-%s-%s.tar" % (package_name, entry["version"], host_platform)
 
-    return BUILD / basename
+def target_toolchain(settings, host_platform, target_triple):
+    """The toolchain to install into build environments of a target's packages."""
+    if not settings.get("needs_toolchain"):
+        return None
+
+    return {
+        "build_dir": BUILD,
+        "host_platform": host_platform,
+        "target_triple": target_triple,
+        "binutils": install_binutils(host_platform),
+        "clang": True,
+        "musl": "musl" in target_triple,
+    }
+
+
+# Target settings influencing the output of simple_build(), through
+# add_target_env() or simple_build() itself. Other settings (e.g. which Python
+# versions a target supports) are left out of cache keys.
+SIMPLE_BUILD_SETTINGS = (
+    "apple_sdk_platform",
+    "bolt_capable",
+    "host_cc",
+    "host_cxx",
+    "needs_toolchain",
+    "openssl_target",
+    "target_cc",
+    "target_cflags",
+    "target_ldflags",
+)
 
 
-def install_binutils(platform):
-    return platform != "macos"
+def simple_build_cache_key(
+    settings,
+    image,
+    entry,
+    host_platform,
+    target_triple,
+    build_options,
+    extra_archives,
+    tools_path,
+):
+    """Derive the artifact cache key for a ``simple_build()``.
+
+    Returns None if the artifact cache is disabled.
+    """
+    if not artifact_cache_root():
+        return None
+
+    index = IntegrityIndex(BUILD / ".integrity-index.json")
+
+    # The packages build_environment() installs for the target.
+    toolchain = {}
+    target = target_toolchain(settings, host_platform, target_triple)
+    if target:
+        for name in toolchain_packages(**target):
+            toolchain[name] = hash_path_indexed(
+                toolchain_archive_path(BUILD, name, host_platform), index
+            )
+
+    with (SUPPORT / ("build-%s.sh" % entry)).open("rb") as fh:
+        script = fh.read().decode("utf-8")
+
+    return artifact_cache_key(
+        {
+            "build_options": build_options,
+            "entry": entry,
+            "extra_archives": {
+                a: hash_path_indexed(
+                    artifact_archive_path(BUILD, a, target_triple, build_options), index
+                )
+                for a in extra_archives or []
+            },
+            "host_platform": host_platform,
+            "image": image,
+            "script": script,
+            "settings": {
+                k: settings[k] for k in SIMPLE_BUILD_SETTINGS if k in settings
+            },
+            "sha256": DOWNLOADS[entry]["sha256"],
+            "target_triple": target_triple,
+            "toolchain": toolchain,
+            "tools_path": tools_path,
+        }
+    )
 
 
 def simple_build(
@@ -248,19 +352,29 @@ def simple_build(
 ):
     archive = download_entry(entry, DOWNLOADS_PATH)
 
-    with build_environment(client, image) as build_env:
-        if settings.get("needs_toolchain"):
-            build_env.install_toolchain(
-                BUILD,
-                host_platform,
-                target_triple,
-                binutils=install_binutils(host_platform),
-                clang=True,
-                musl="musl" in target_triple,
-            )
+    cache_key = simple_build_cache_key(
+        settings,
+        image,
+        entry,
+        host_platform,
+        target_triple,
+        build_options,
+        extra_archives,
+        tools_path,
+    )
 
-        for a in extra_archives or []:
-            build_env.install_artifact_archive(BUILD, a, target_triple, build_options)
+    if cache_key and artifact_cache_get(cache_key, dest_archive):
+        return
+
+    with build_environment(
+        client,
+        image,
+        toolchain=target_toolchain(settings, host_platform, target_triple),
+    ) as build_env:
+        if extra_archives:
+            build_env.install_artifact_archives(
+                BUILD, extra_archives, target_triple, build_options
+            )
 
         build_env.copy_file(archive)
         build_env.copy_file(SUPPORT / ("build-%s.sh" % entry))
@@ -281,6 +395,9 @@ def simple_build(
 
         build_env.get_tools_archive(dest_archive, tools_path)
 
+    if cache_key:
+        artifact_cache_put(cache_key, dest_archive)
+
 
 def build_binutils(client, image, host_platform):
     """Build binutils in the Docker image."""
@@ -302,7 +419,7 @@ def build_binutils(client, image, host_platform):
         )
 
         build_env.get_tools_archive(
-            toolchain_archive_path("binutils", host_platform), "host"
+            toolchain_archive_path(BUILD, "binutils", host_platform), "host"
         )
 
 
@@ -325,10 +442,15 @@ def materialize_clang(host_platform: str, target_triple: str):
 def build_musl(client, image, host_platform: str, target_triple: str):
     musl_archive = download_entry("musl", DOWNLOADS_PATH)
 
-    with build_environment(client, image) as build_env:
-        build_env.install_toolchain(
-            BUILD, host_platform, target_triple, binutils=True, clang=True
-        )
+    toolchain = {
+        "build_dir": BUILD,
+        "host_platform": host_platform,
+        "target_triple": target_triple,
+        "binutils": True,
+        "clang": True,
+    }
+
+    with build_environment(client, image, toolchain=toolchain) as build_env:
         build_env.copy_file(musl_archive)
         build_env.copy_file(SUPPORT / "build-musl.sh")
 
@@ -340,7 +462,7 @@ def build_musl(client, image, host_platform: str, target_triple: str):
         build_env.run("build-musl.sh", environment=env)
 
         build_env.get_tools_archive(
-            toolchain_archive_path("musl", host_platform), "host"
+            toolchain_archive_path(BUILD, "musl", host_platform), "host"
         )
 
 
@@ -349,19 +471,16 @@ def build_libedit(
 ):
     libedit_archive = download_entry("libedit", DOWNLOADS_PATH)
 
-    with build_environment(client, image) as build_env:
-        if settings.get("needs_toolchain"):
-            build_env.install_toolchain(
-                BUILD,
-                host_platform,
-                target_triple,
-                binutils=install_binutils(host_platform),
-                clang=True,
-                musl="musl" in target_triple,
-            )
-
-        build_env.install_artifact_archive(
-            BUILD, "ncurses", target_triple, build_options
+    with build_environment(
+        client,
+        image,
+        toolchain=target_toolchain(settings, host_platform, target_triple),
+    ) as build_env:
+        build_env.install_artifact_archives(
+            BUILD,
+            package_extra_archives("libedit", host_platform),
+            target_triple,
+            build_options,
         )
         build_env.copy_file(libedit_archive)
         build_env.copy_file(SUPPORT / "build-libedit.sh")
@@ -383,23 +502,16 @@ def build_tix(
     tk_archive = download_entry("tk", DOWNLOADS_PATH)
     tix_archive = download_entry("tix", DOWNLOADS_PATH)
 
-    with build_environment(client, image) as build_env:
-        if settings.get("needs_toolchain"):
-            build_env.install_toolchain(
-                BUILD,
-                host_platform,
-                target_triple,
-                binutils=install_binutils(host_platform),
-                clang=True,
-                musl="musl" in target_triple,
-            )
-
-        depends = {"tcl", "tk"}
-        if host_platform != "macos":
-            depends |= {"libX11", "xorgproto"}
+    with build_environment(
+        client,
+        image,
+        toolchain=target_toolchain(settings, host_platform, target_triple),
+    ) as build_env:
+        depends = package_extra_archives("tix", host_platform)
 
-        for p in sorted(depends):
-            build_env.install_artifact_archive(BUILD, p, target_triple, build_options)
+        build_env.install_artifact_archives(
+            BUILD, sorted(depends), target_triple, build_options
+        )
 
         for p in (tcl_archive, tk_archive, tix_archive, SUPPORT / "build-tix.sh"):
             build_env.copy_file(p)
@@ -429,16 +541,16 @@ def build_cpython_host(
     """Build binutils in the Docker image."""
     archive = download_entry(entry, DOWNLOADS_PATH)
 
-    with build_environment(client, image) as build_env:
-        python_version = DOWNLOADS[entry]["version"]
+    toolchain = {
+        "build_dir": BUILD,
+        "host_platform": host_platform,
+        "target_triple": target_triple,
+        "binutils": install_binutils(host_platform),
+        "clang": True,
+    }
 
-        build_env.install_toolchain(
-            BUILD,
-            host_platform,
-            target_triple,
-            binutils=install_binutils(host_platform),
-            clang=True,
-        )
+    with build_environment(client, image, toolchain=toolchain) as build_env:
+        python_version = DOWNLOADS[entry]["version"]
 
         build_env.copy_file(archive)
 
@@ -454,8 +566,9 @@ def build_cpython_host(
             "autoconf",
             "m4",
         }
-        for p in sorted(packages):
-            build_env.install_artifact_archive(BUILD, p, target_triple, build_options)
+        build_env.install_artifact_archives(
+            BUILD, sorted(packages), target_triple, build_options
+        )
 
         env = {
             "PYTHON_VERSION": python_version,
@@ -692,6 +805,163 @@ def python_build_info(
     return bi
 
 
+@contextlib.contextmanager
+def cpython_build_environment(
+    settings,
+    client,
+    image,
+    host_platform,
+    target_triple,
+    build_options,
+    entry_name,
+    python_version,
+):
+    """Create an environment to build CPython in with its dependencies installed.
+
+    For incremental builds, the environment persists across builds of the same
+    Python version, target, and build options. Dependencies are only installed
+    again if any of them changed.
+    """
+    toolchain = target_toolchain(settings, host_platform, target_triple)
+
+    packages = target_needs(TARGETS_CONFIG, target_triple, python_version)
+    # Toolchain packages are handled specially.
+    packages.discard("binutils")
+    packages.discard("musl")
+
+    def install(build_env):
+        build_env.install_artifact_archives(
+            BUILD, sorted(packages), target_triple, build_options
+        )
+
+        build_env.install_toolchain_archive(
+            BUILD, entry_name, host_platform, version=python_version
+        )
+
+    incremental_path = incremental_build_path()
+
+    if not incremental_path:
+        with build_environment(client, image, toolchain=toolchain) as build_env:
+            install(build_env)
+            yield build_env
+
+        return
+
+    archives = [
+        artifact_archive_path(BUILD, p, target_triple, build_options)
+        for p in sorted(packages)
+    ]
+    archives.append(
+        toolchain_archive_path(BUILD, entry_name, host_platform, version=python_version)
+    )
+    if toolchain:
+        for p in toolchain_packages(**toolchain):
+            archives.append(toolchain_archive_path(BUILD, p, host_platform))
+
+    index = IntegrityIndex(BUILD / ".integrity-index.json")
+    key = artifact_cache_key(
+        {
+            "archives": {a.name: hash_path_indexed(a, index) for a in archives},
+            "image": image,
+        }
+    )
+
+    with persistent_build_environment(
+        client,
+        image,
+        incremental_path
+        / ("cpython-%s-%s-%s" % (python_version, target_triple, build_options)),
+        key,
+        install,
+        toolchain=toolchain,
+    ) as build_env:
+        yield build_env
+
+
+# Paths of a --python-source directory that aren't copied into the build
+# environment: version control metadata and in-tree build outputs.
+PYTHON_SOURCE_EXCLUDES = (
+    ".git",
+    ".hg",
+    "__pycache__",
+    "*.a",
+    "*.gcda",
+    "*.o",
+    "*.pyc",
+)
+
+
+def python_source_key(python_source: pathlib.Path) -> str:
+    """Derive a key of a --python-source directory from its file metadata."""
+    return artifact_cache_key(
+        [
+            [ti.name, ti.size, ti.mtime, ti.linkname]
+            for ti, _ in tar_members_from_directory(
+                python_source, normalize=False, exclude=PYTHON_SOURCE_EXCLUDES
+            )
+        ]
+    )
+
+
+def cpython_incremental_env(env, python_source):
+    """Environment variables telling build-cpython.sh what it may reuse.
+
+    Configure results are reused as long as the build environment and
+    build-cpython.sh are unchanged. The configured source tree is reused as
+    long as the Python source archive or directory and patches are unchanged
+    as well.
+    """
+    index = IntegrityIndex(BUILD / ".integrity-index.json")
+
+    configure_stamp = artifact_cache_key(
+        {
+            # Parallelism doesn't influence configure.
+            "env": {
+                k: v
+                for k, v in env.items()
+                if k not in ("NUM_CPUS", "NUM_JOBS_AGGRESSIVE")
+            },
+            "script": hash_path_indexed(SUPPORT / "build-cpython.sh", index),
+        }
+    )
+
+    source_stamp = artifact_cache_key(
+        {
+            "configure": configure_stamp,
+            "patches": {
+                f: hash_path_indexed(SUPPORT / f, index)
+                for f in sorted(os.listdir(SUPPORT))
+                if f.endswith(".patch")
+            },
+            "python": (
+                python_source_key(python_source)
+                if python_source.is_dir()
+                else hash_path_indexed(python_source, index)
+            ),
+        }
+    )
+
+    return {
+        "CPYTHON_INCREMENTAL": "1",
+        "CPYTHON_CONFIGURE_STAMP": configure_stamp,
+        "CPYTHON_SOURCE_STAMP": source_stamp,
+    }
+
+
+def cpython_source_reusable(build_env, python_version, source_stamp):
+    """Whether build-cpython.sh will reuse the source tree of an incremental build.
+
+    This mirrors the check in build-cpython.sh.
+    """
+    try:
+        stamp = build_env.get_file("source.stamp")
+        build_env.get_file("Python-%s/Makefile" % python_version)
+    except (FileNotFoundError, docker.errors.NotFound):
+        return False
+
+    return stamp.decode("utf-8").strip() == source_stamp
+
+
 def build_cpython(
     settings,
     client,
@@ -710,14 +980,17 @@ def build_cpython(
     if not python_source:
         python_version = entry["version"]
         python_archive = download_entry(entry_name, DOWNLOADS_PATH)
+        setup_source = setup_source_path(
+            python_archive,
+            python_version,
+            DOWNLOADS_PATH / "cpython-setup",
+            entry["sha256"],
+        )
     else:
         python_version = os.environ["PYBUILD_PYTHON_VERSION"]
-        python_archive = DOWNLOADS_PATH / ("Python-%s.tar.xz" % python_version)
-        print("Compressing %s to %s" % (python_source, python_archive))
-        with python_archive.open("wb") as fh:
-            create_tar_from_directory(
-                fh, python_source, path_prefix="Python-%s" % python_version
-            )
+        # The source directory is copied into the build environment as is.
+        python_archive = None
+        setup_source = python_source
 
     setuptools_archive = download_entry("setuptools", DOWNLOADS_PATH)
     pip_archive = download_entry("pip", DOWNLOADS_PATH)
@@ -725,7 +998,7 @@ def build_cpython(
     ems = extension_modules_config(EXTENSION_MODULES)
 
     setup = derive_setup_local(
-        python_archive,
+        setup_source,
         python_version=python_version,
         target_triple=target_triple,
         extension_modules=ems,
@@ -735,31 +1008,20 @@ def build_cpython(
     setup_local_content = setup["setup_local"]
     extra_make_content = setup["make_data"]
 
-    with build_environment(client, image) as build_env:
-        if settings.get("needs_toolchain"):
-            build_env.install_toolchain(
-                BUILD,
-                host_platform,
-                target_triple,
-                binutils=install_binutils(host_platform),
-                clang=True,
-                musl="musl" in target_triple,
-            )
-
-        packages = target_needs(TARGETS_CONFIG, target_triple, python_version)
-        # Toolchain packages are handled specially.
-        packages.discard("binutils")
-        packages.discard("musl")
-
-        for p in sorted(packages):
-            build_env.install_artifact_archive(BUILD, p, target_triple, build_options)
-
-        build_env.install_toolchain_archive(
-            BUILD, entry_name, host_platform, version=python_version
-        )
+    with cpython_build_environment(
+        settings,
+        client,
+        image,
+        host_platform,
+        target_triple,
+        build_options,
+        entry_name,
+        python_version,
+    ) as build_env:
+        if not python_source:
+            build_env.copy_file(python_archive)
 
         for p in (
-            python_archive,
             setuptools_archive,
             pip_archive,
             SUPPORT / "build-cpython.sh",
@@ -821,6 +1083,28 @@ def build_cpython(
 
         add_target_env(env, host_platform, target_triple, build_env)
 
+        # The CPython build is typically the only build running at the end of
+        # the build graph, so it can use more cores than dependency builds.
+        if "PYBUILD_CPYTHON_JOBS" in os.environ:
+            jobs = int(os.environ["PYBUILD_CPYTHON_JOBS"])
+            env["NUM_CPUS"] = "%d" % jobs
+            env["NUM_JOBS_AGGRESSIVE"] = "%d" % max(jobs + 2, jobs * 2)
+
+        if incremental_build_path():
+            env.update(cpython_incremental_env(env, python_archive or python_source))
+
+        # Copying a checkout is wasted if an incremental build reuses the
+        # source tree from the previous build.
+        if python_source and not (
+            incremental_build_path()
+            and cpython_source_reusable(
+                build_env, python_version, env["CPYTHON_SOURCE_STAMP"]
+            )
+        ):
+            build_env.copy_directory(
+                python_source, "python-source", exclude=PYTHON_SOURCE_EXCLUDES
+            )
+
         build_env.run("build-cpython.sh", environment=env)
 
         extension_module_loading = ["builtin"]
@@ -920,8 +1204,7 @@ def build_cpython(
 
             build_env.copy_file(fh.name, dest_path, dest_name="PYTHON.json")
 
-        with open(dest_archive, "wb") as fh:
-            fh.write(build_env.get_output_archive("python"))
+        build_env.write_output_archive("python", dest_archive)
 
 
 def main():
@@ -990,6 +1273,8 @@ def main():
         log_name = "dockerfiles"
     elif args.action == "makefiles":
         log_name = "makefiles"
+    elif args.action == "prefetch":
+        log_name = "prefetch"
     elif args.action.startswith("image-"):
         log_name = "image-%s" % action
     elif args.toolchain:
@@ -998,6 +1283,11 @@ def main():
         log_name = args.action
     else:
         entry = DOWNLOADS[action]
+
+        # Dependency packages are shared between build option variants.
+        if not action.startswith("cpython-"):
+            build_options = DEPENDENCY_BUILD_OPTIONS
+
         log_name = "%s-%s-%s-%s" % (
             action,
             entry["version"],
@@ -1006,239 +1296,286 @@ def main():
         )
 
     log_path = BUILD / "logs" / ("build.%s.log" % log_name)
+    compress_logs = "PYBUILD_COMPRESS_LOGS" in os.environ
+    if compress_logs:
+        log_path = log_path.with_suffix(".log.zst")
+    verbosity = VERBOSITY_LEVELS[os.environ.get("PYBUILD_LOG_LEVEL", "verbose")]
+
+    # Concurrent builds (e.g. build-main.py building multiple variants) may
+    # attempt to produce the same archive, such as a dependency shared between
+    # build options or a toolchain shared between targets. Serialize them and
+    # skip the work if another process produced the archive while we waited.
+    if action in ("dockerfiles", "makefiles", "prefetch"):
+        lock = contextlib.nullcontext()
+    else:
+        lock = exclusive_lock(dest_archive.with_name("%s.lock" % dest_archive.name))
+
+    def archive_mtime():
+        try:
+            return dest_archive.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
 
-    with log_path.open("wb") as log_fh:
-        set_logger(action, log_fh)
-        if action == "dockerfiles":
-            write_dockerfiles(SUPPORT, BUILD)
-        elif action == "makefiles":
-            targets = get_targets(TARGETS_CONFIG)
-            write_triples_makefiles(targets, BUILD, SUPPORT)
-            write_target_settings(targets, BUILD / "targets")
-            write_package_versions(BUILD / "versions")
-
-            # Override the DOWNLOADS package entry for CPython for the local build
-            if python_source:
-                write_cpython_version(
-                    BUILD / "versions", os.environ["PYBUILD_PYTHON_VERSION"]
+    initial_mtime = archive_mtime()
+
+    with lock:
+        if action not in ("dockerfiles", "makefiles", "prefetch") and (
+            archive_mtime() != initial_mtime
+        ):
+            print("%s was produced by another process" % dest_archive)
+            return 0
+
+        set_tracer(
+            os.environ.get("PYBUILD_TRACE"),
+            log_name,
+            target_triple=target_triple,
+            build_options=build_options,
+        )
+
+        prerequisites = [
+            os.path.abspath(p)
+            for p in os.environ.get("PYBUILD_PREREQUISITES", "").split()
+        ]
+
+        timing = timed(
+            action,
+            category="action",
+            dest_archive=os.path.abspath(dest_archive),
+            prerequisites=prerequisites,
+        )
+
+        build_log = log_to_file(
+            action, log_path, verbosity=verbosity, compress=compress_logs
+        )
+
+        with build_log, timing:
+            if action == "dockerfiles":
+                write_dockerfiles(SUPPORT, BUILD)
+            elif action == "makefiles":
+                targets = get_targets(TARGETS_CONFIG)
+                write_triples_makefiles(targets, BUILD, SUPPORT)
+                write_target_settings(targets, BUILD / "targets")
+                write_package_versions(BUILD / "versions")
+
+                # Override the DOWNLOADS package entry for CPython for the local build
+                if python_source:
+                    write_cpython_version(
+                        BUILD / "versions", os.environ["PYBUILD_PYTHON_VERSION"]
+                    )
+
+            elif action == "prefetch":
+                python_version = os.environ["PYBUILD_PYTHON_VERSION"]
+                python_majmin = ".".join(python_version.split(".")[0:2])
+
+                keys = target_downloads(
+                    TARGETS_CONFIG,
+                    target_triple,
+                    host_platform,
+                    python_version,
+                    python_entry=None
+                    if python_source
+                    else "cpython-%s" % python_majmin,
                 )
 
-        elif action.startswith("image-"):
-            image_name = action[6:]
-            image_path = BUILD / ("%s.Dockerfile" % image_name)
-            with image_path.open("rb") as fh:
-                image_data = fh.read()
+                prefetch_downloads(keys, DOWNLOADS_PATH)
 
-            build_docker_image(client, image_data, BUILD, image_name)
+            elif action.startswith("image-"):
+                image_name = action[6:]
+                image_path = BUILD / ("%s.Dockerfile" % image_name)
+                with image_path.open("rb") as fh:
+                    image_data = fh.read()
 
-        elif action == "binutils":
-            build_binutils(client, get_image(client, ROOT, BUILD, "gcc"), host_platform)
+                build_docker_image(client, image_data, BUILD, image_name)
 
-        elif action == "clang":
-            materialize_clang(host_platform, target_triple)
+            elif action == "binutils":
+                build_binutils(
+                    client, get_image(client, ROOT, BUILD, "gcc"), host_platform
+                )
 
-        elif action == "musl":
-            build_musl(
-                client,
-                get_image(client, ROOT, BUILD, "gcc"),
-                host_platform,
-                target_triple,
-            )
+            elif action == "clang":
+                materialize_clang(host_platform, target_triple)
 
-        elif action == "autoconf":
-            simple_build(
-                settings,
-                client,
-                get_image(client, ROOT, BUILD, docker_image),
-                action,
-                host_platform=host_platform,
-                target_triple=target_triple,
-                build_options=build_options,
-                dest_archive=dest_archive,
-                tools_path="host",
-                extra_archives=["m4"],
-            )
+            elif action == "musl":
+                build_musl(
+                    client,
+                    get_image(client, ROOT, BUILD, "gcc"),
+                    host_platform,
+                    target_triple,
+                )
 
-        elif action == "libedit":
-            build_libedit(
-                settings,
-                client,
-                get_image(client, ROOT, BUILD, docker_image),
-                host_platform=host_platform,
-                target_triple=target_triple,
-                build_options=build_options,
-                dest_archive=dest_archive,
-            )
+            elif action == "autoconf":
+                simple_build(
+                    settings,
+                    client,
+                    get_image(client, ROOT, BUILD, docker_image),
+                    action,
+                    host_platform=host_platform,
+                    target_triple=target_triple,
+                    build_options=build_options,
+                    dest_archive=dest_archive,
+                    tools_path="host",
+                    extra_archives=package_extra_archives(action, host_platform),
+                )
 
-        elif action in (
-            "bdb",
-            "bzip2",
-            "expat",
-            "inputproto",
-            "kbproto",
-            "libffi-3.3",
-            "libffi",
-            "libpthread-stubs",
-            "m4",
-            "mpdecimal",
-            "ncurses",
-            "openssl-1.1",
-            "openssl-3.0",
-            "patchelf",
-            "sqlite",
-            "tcl",
-            "uuid",
-            "x11-util-macros",
-            "xextproto",
-            "xorgproto",
-            "xproto",
-            "xtrans",
-            "xz",
-            "zlib",
-        ):
-            tools_path = "host" if action in ("m4", "patchelf") else "deps"
-
-            simple_build(
-                settings,
-                client,
-                get_image(client, ROOT, BUILD, docker_image),
-                action,
-                host_platform=host_platform,
-                target_triple=target_triple,
-                build_options=build_options,
-                dest_archive=dest_archive,
-                tools_path=tools_path,
-            )
+            elif action == "libedit":
+                build_libedit(
+                    settings,
+                    client,
+                    get_image(client, ROOT, BUILD, docker_image),
+                    host_platform=host_platform,
+                    target_triple=target_triple,
+                    build_options=build_options,
+                    dest_archive=dest_archive,
+                )
 
-        elif action == "libX11":
-            simple_build(
-                settings,
-                client,
-                get_image(client, ROOT, BUILD, docker_image),
-                action,
-                host_platform=host_platform,
-                target_triple=target_triple,
-                build_options=build_options,
-                dest_archive=dest_archive,
-                extra_archives={
-                    "inputproto",
-                    "kbproto",
-                    "libpthread-stubs",
-                    "libXau",
-                    "libxcb",
-                    "x11-util-macros",
-                    "xextproto",
-                    "xorgproto",
-                    "xproto",
-                    "xtrans",
-                },
-            )
+            elif action in (
+                "bdb",
+                "bzip2",
+                "expat",
+                "inputproto",
+                "kbproto",
+                "libffi-3.3",
+                "libffi",
+                "libpthread-stubs",
+                "m4",
+                "mpdecimal",
+                "ncurses",
+                "openssl-1.1",
+                "openssl-3.0",
+                "patchelf",
+                "sqlite",
+                "tcl",
+                "uuid",
+                "x11-util-macros",
+                "xextproto",
+                "xorgproto",
+                "xproto",
+                "xtrans",
+                "xz",
+                "zlib",
+            ):
+                tools_path = "host" if action in ("m4", "patchelf") else "deps"
+
+                simple_build(
+                    settings,
+                    client,
+                    get_image(client, ROOT, BUILD, docker_image),
+                    action,
+                    host_platform=host_platform,
+                    target_triple=target_triple,
+                    build_options=build_options,
+                    dest_archive=dest_archive,
+                    tools_path=tools_path,
+                )
 
-        elif action == "libXau":
-            simple_build(
-                settings,
-                client,
-                get_image(client, ROOT, BUILD, docker_image),
-                action,
-                host_platform=host_platform,
-                target_triple=target_triple,
-                build_options=build_options,
-                dest_archive=dest_archive,
-                extra_archives={"x11-util-macros", "xproto"},
-            )
+            elif action == "libX11":
+                simple_build(
+                    settings,
+                    client,
+                    get_image(client, ROOT, BUILD, docker_image),
+                    action,
+                    host_platform=host_platform,
+                    target_triple=target_triple,
+                    build_options=build_options,
+                    dest_archive=dest_archive,
+                    extra_archives=package_extra_archives(action, host_platform),
+                )
 
-        elif action == "xcb-proto":
-            simple_build(
-                settings,
-                client,
-                get_image(client, ROOT, BUILD, docker_image),
-                action,
-                host_platform=host_platform,
-                target_triple=target_triple,
-                build_options=build_options,
-                dest_archive=dest_archive,
-            )
+            elif action == "libXau":
+                simple_build(
+                    settings,
+                    client,
+                    get_image(client, ROOT, BUILD, docker_image),
+                    action,
+                    host_platform=host_platform,
+                    target_triple=target_triple,
+                    build_options=build_options,
+                    dest_archive=dest_archive,
+                    extra_archives=package_extra_archives(action, host_platform),
+                )
 
-        elif action == "libxcb":
-            simple_build(
-                settings,
-                client,
-                get_image(client, ROOT, BUILD, docker_image),
-                action,
-                host_platform=host_platform,
-                target_triple=target_triple,
-                build_options=build_options,
-                dest_archive=dest_archive,
-                extra_archives={"libpthread-stubs", "libXau", "xcb-proto", "xproto"},
-            )
+            elif action == "xcb-proto":
+                simple_build(
+                    settings,
+                    client,
+                    get_image(client, ROOT, BUILD, docker_image),
+                    action,
+                    host_platform=host_platform,
+                    target_triple=target_triple,
+                    build_options=build_options,
+                    dest_archive=dest_archive,
+                )
 
-        elif action == "tix":
-            build_tix(
-                settings,
-                client,
-                get_image(client, ROOT, BUILD, docker_image),
-                host_platform=host_platform,
-                target_triple=target_triple,
-                build_options=build_options,
-                dest_archive=dest_archive,
-            )
+            elif action == "libxcb":
+                simple_build(
+                    settings,
+                    client,
+                    get_image(client, ROOT, BUILD, docker_image),
+                    action,
+                    host_platform=host_platform,
+                    target_triple=target_triple,
+                    build_options=build_options,
+                    dest_archive=dest_archive,
+                    extra_archives=package_extra_archives(action, host_platform),
+                )
 
-        elif action == "tk":
-            extra_archives = {"tcl"}
-            if host_platform != "macos":
-                extra_archives |= {
-                    "libX11",
-                    "libXau",
-                    "libxcb",
-                    "xcb-proto",
-                    "xorgproto",
-                }
+            elif action == "tix":
+                build_tix(
+                    settings,
+                    client,
+                    get_image(client, ROOT, BUILD, docker_image),
+                    host_platform=host_platform,
+                    target_triple=target_triple,
+                    build_options=build_options,
+                    dest_archive=dest_archive,
+                )
 
-            simple_build(
-                settings,
-                client,
-                get_image(client, ROOT, BUILD, docker_image),
-                action,
-                host_platform=host_platform,
-                target_triple=target_triple,
-                build_options=build_options,
-                dest_archive=dest_archive,
-                extra_archives=extra_archives,
-            )
+            elif action == "tk":
+                simple_build(
+                    settings,
+                    client,
+                    get_image(client, ROOT, BUILD, docker_image),
+                    action,
+                    host_platform=host_platform,
+                    target_triple=target_triple,
+                    build_options=build_options,
+                    dest_archive=dest_archive,
+                    extra_archives=package_extra_archives(action, host_platform),
+                )
 
-        elif action.startswith("cpython-") and action.endswith("-host"):
-            build_cpython_host(
-                client,
-                get_image(client, ROOT, BUILD, docker_image),
-                action[:-5],
-                host_platform=host_platform,
-                target_triple=target_triple,
-                build_options=build_options,
-                dest_archive=dest_archive,
-            )
+            elif action.startswith("cpython-") and action.endswith("-host"):
+                build_cpython_host(
+                    client,
+                    get_image(client, ROOT, BUILD, docker_image),
+                    action[:-5],
+                    host_platform=host_platform,
+                    target_triple=target_triple,
+                    build_options=build_options,
+                    dest_archive=dest_archive,
+                )
 
-        elif action in (
-            "cpython-3.9",
-            "cpython-3.10",
-            "cpython-3.11",
-            "cpython-3.12",
-            "cpython-3.13",
-        ):
-            build_cpython(
-                settings,
-                client,
-                get_image(client, ROOT, BUILD, docker_image),
-                host_platform=host_platform,
-                target_triple=target_triple,
-                build_options=build_options,
-                dest_archive=dest_archive,
-                version=action.split("-")[1],
-                python_source=python_source,
-            )
+            elif action in (
+                "cpython-3.9",
+                "cpython-3.10",
+                "cpython-3.11",
+                "cpython-3.12",
+                "cpython-3.13",
+            ):
+                build_cpython(
+                    settings,
+                    client,
+                    get_image(client, ROOT, BUILD, docker_image),
+                    host_platform=host_platform,
+                    target_triple=target_triple,
+                    build_options=build_options,
+                    dest_archive=dest_archive,
+                    version=action.split("-")[1],
+                    python_source=python_source,
+                )
 
-        else:
-            print("unknown build action: %s" % action)
-            return 1
+            else:
+                print("unknown build action: %s" % action)
+                return 1
 
 
 if __name__ == "__main__":
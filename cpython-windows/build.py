@@ -5,7 +5,6 @@
 
 import argparse
 import concurrent.futures
-import io
 import json
 import multiprocessing
 import os
@@ -26,13 +25,15 @@ from pythonbuild.cpython import (
 from pythonbuild.downloads import DOWNLOADS
 from pythonbuild.utils import (
     compress_python_archive,
+    copy_artifact,
     create_tar_from_directory,
     download_entry,
     extract_tar_to_directory,
     extract_zip_to_directory,
-    normalize_tar_archive,
+    install_only_basename,
     release_tag_from_git,
     validate_python_json,
+    write_normalized_tar_from_directory_to_path,
 )
 
 ROOT = pathlib.Path(os.path.abspath(__file__)).parent.parent
@@ -1643,19 +1644,7 @@ def build_cpython(
             )
         )
 
-        data = io.BytesIO()
-        create_tar_from_directory(data, td / "out")
-        data.seek(0)
-
-        data = normalize_tar_archive(data)
-
-        with dest_path.open("wb") as fh:
-            while True:
-                chunk = data.read(32768)
-                if not chunk:
-                    break
-
-                fh.write(chunk)
+        write_normalized_tar_from_directory_to_path(td / "out", dest_path)
 
         return dest_path
 
@@ -1706,8 +1695,29 @@ def main() -> None:
         default="10.0.20348.0",
         help="Windows SDK version to build with",
     )
+    parser.add_argument(
+        "--install-only",
+        action="store_true",
+        help="Also produce the install_only and install_only_stripped archives "
+        "while compressing",
+    )
+    parser.add_argument(
+        "--llvm-strip",
+        help="Path to the llvm-strip producing the install_only_stripped archive "
+        "(defaults to llvm-strip on PATH)",
+    )
 
     args = parser.parse_args()
+
+    if args.llvm_strip and not args.install_only:
+        raise Exception("--llvm-strip requires --install-only")
+
+    llvm_strip = None
+    if args.install_only:
+        llvm_strip = args.llvm_strip or shutil.which("llvm-strip")
+        if not llvm_strip:
+            raise Exception("llvm-strip not found; pass --llvm-strip")
+
     build_options = args.options
 
     log_path = BUILD / "build.log"
@@ -1774,10 +1784,13 @@ def main() -> None:
             release_tag = release_tag_from_git()
 
         # Create, e.g., `cpython-3.10.13+20240224-x86_64-pc-windows-msvc-pgo.tar.zst`.
+        dist_basename = "%s-%s" % (tar_path.stem, release_tag)
         dest_path = compress_python_archive(
             tar_path,
             DIST,
-            "%s-%s" % (tar_path.stem, release_tag),
+            dist_basename,
+            install_only=args.install_only,
+            llvm_strip=llvm_strip,
         )
 
         # Copy to, e.g., `cpython-3.10.13+20240224-x86_64-pc-windows-msvc-shared-pgo.tar.zst`.
@@ -1788,7 +1801,18 @@ def main() -> None:
             raise ValueError("expected filename to end with profile: %s" % filename)
         filename = filename.removesuffix("-%s-%s.tar.zst" % (args.options, release_tag))
         filename = filename + "-shared-%s-%s.tar.zst" % (args.options, release_tag)
-        shutil.copy2(dest_path, dest_path.with_name(filename))
+        copy_artifact(dest_path, dest_path.with_name(filename))
+
+        # Likewise for the install_only archives, e.g.
+        # `cpython-3.10.13+20240224-x86_64-pc-windows-msvc-shared-install_only.tar.gz`.
+        if args.install_only:
+            shared_basename = filename.removesuffix(".tar.zst")
+            for flavor in ("install_only", "install_only_stripped"):
+                copy_artifact(
+                    DIST / ("%s.tar.gz" % install_only_basename(dist_basename, flavor)),
+                    DIST
+                    / ("%s.tar.gz" % install_only_basename(shared_basename, flavor)),
+                )
 
 
 if __name__ == "__main__":
@@ -2,30 +2,139 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
+import concurrent.futures
 import contextlib
 import fnmatch
 import io
+import json
 import os
 import pathlib
 import shutil
+import stat
 import tarfile
 import tempfile
 
-from .docker import container_exec, container_get_archive, copy_file_to_container
+import docker  # type: ignore
+
+from .docker import (
+    BIND_MOUNT_PATH,
+    acquire_pooled_container,
+    container_exec,
+    container_get_archive,
+    container_pool_path,
+    container_write_archive,
+    copy_directory_to_container,
+    copy_file_to_container,
+    copy_files_to_container,
+    docker_bind_mount,
+    release_pooled_container,
+    start_container,
+)
 from .downloads import DOWNLOADS
-from .logging import log
+from .logging import log, timed
 from .utils import (
+    DEPENDENCY_BUILD_OPTIONS,
+    IntegrityIndex,
+    artifact_cache_key,
     clang_toolchain,
     create_tar_from_directory,
+    exclusive_lock,
     exec_and_log,
-    extract_tar_to_directory,
-    normalize_tar_archive,
+    extract_tar_to_directory_cached,
+    hash_path_indexed,
+    populate_directory,
+    random_suffix,
+    write_normalized_tar_archive,
+    write_normalized_tar_from_directory_to_path,
 )
 
 
+def toolchain_packages(
+    host_platform,
+    target_triple: str,
+    binutils=False,
+    musl=False,
+    clang=False,
+    build_dir=None,
+):
+    """Names of the toolchain packages to install into a build environment.
+
+    Accepts the keyword arguments of ``install_toolchain()``, so the toolchain
+    passed to ``build_environment()`` can be resolved with
+    ``toolchain_packages(**toolchain)``.
+    """
+    packages = []
+
+    if binutils:
+        packages.append("binutils")
+
+    if clang:
+        packages.append(clang_toolchain(host_platform, target_triple))
+
+    if musl:
+        packages.append("musl")
+
+    return packages
+
+
+def toolchain_archive_path(build_dir, package_name, host_platform, version=None):
+    entry = DOWNLOADS[package_name]
+    basename = "%s-%s-%s.tar" % (
+        package_name,
+        version or entry["version"],
+        host_platform,
+    )
+
+    return build_dir / basename
+
+
+def artifact_archive_path(build_dir, package_name, target_triple, build_options):
+    entry = DOWNLOADS[package_name]
+
+    if not package_name.startswith("cpython-"):
+        build_options = DEPENDENCY_BUILD_OPTIONS
+
+    basename = "%s-%s-%s-%s.tar" % (
+        package_name,
+        entry["version"],
+        target_triple,
+        build_options,
+    )
+
+    return build_dir / basename
+
+
+def archive_collisions(paths):
+    """Find files provided by more than one of a set of tar archives.
+
+    Returns a dict of member names to the archives providing them.
+    """
+    providers = {}
+
+    for p in paths:
+        with tarfile.open(p, "r:") as tf:
+            for ti in tf:
+                if not ti.isdir():
+                    providers.setdefault(os.path.normpath(ti.name), []).append(p.name)
+
+    return {k: v for k, v in sorted(providers.items()) if len(v) > 1}
+
+
+def log_archive_collisions(collisions):
+    for name, archives in collisions.items():
+        log("%s is provided by multiple archives: %s" % (name, ", ".join(archives)))
+
+    log("extracting archives sequentially because %d files collide" % len(collisions))
+
+
+# Repository of images with toolchains installed.
+TOOLCHAIN_IMAGE_REPOSITORY = "pybuild-toolchain"
+
+
 class ContainerContext(object):
-    def __init__(self, container):
+    def __init__(self, container, bind_mount=None):
         self.container = container
+        self.bind_mount = bind_mount
 
         self.tools_path = "/tools"
 
@@ -33,40 +142,112 @@ class ContainerContext(object):
     def is_isolated(self):
         return True
 
+    def mounted_path(self, source):
+        """The path of a host file in the container if it is bind mounted."""
+        if not self.bind_mount:
+            return None
+
+        try:
+            rel = pathlib.Path(os.path.realpath(source)).relative_to(self.bind_mount)
+        except ValueError:
+            return None
+
+        return "%s/%s" % (BIND_MOUNT_PATH, rel.as_posix())
+
     def copy_file(self, source: pathlib.Path, dest_path=None, dest_name=None):
         dest_name = dest_name or source.name
         dest_path = dest_path or "/build"
-        copy_file_to_container(source, self.container, dest_path, dest_name)
+
+        mounted = self.mounted_path(source)
+        if mounted:
+            log("linking %s to container:%s/%s" % (mounted, dest_path, dest_name))
+            self.run(
+                ["/bin/ln", "-sf", mounted, "%s/%s" % (dest_path, dest_name)],
+                user="root",
+            )
+            return
+
+        with timed("copy_file", source=str(source)) as t:
+            copy_file_to_container(source, self.container, dest_path, dest_name)
+            t["bytes"] = os.path.getsize(source)
+
+    def copy_directory(self, source: pathlib.Path, dest_name, exclude=()):
+        """Copy a directory on the host to /build/<dest_name>, replacing it."""
+        dest = "/build/%s" % dest_name
+        self.run(["/bin/rm", "-rf", dest])
+
+        with timed("copy_directory", source=str(source)) as t:
+            t["bytes"] = copy_directory_to_container(
+                source, self.container, "/build", dest_name, exclude=exclude
+            )
+
+        # Docker extracts files with the owner recorded in the archive.
+        self.run(["/bin/chown", "-R", "build:build", dest], user="root")
 
     def install_toolchain_archive(
         self, build_dir, package_name, host_platform, version=None
     ):
-        entry = DOWNLOADS[package_name]
-        basename = "%s-%s-%s.tar" % (
-            package_name,
-            version or entry["version"],
-            host_platform,
+        self.extract_archive(
+            toolchain_archive_path(build_dir, package_name, host_platform, version)
         )
 
-        p = build_dir / basename
-        self.copy_file(p)
-        self.run(["/bin/tar", "-C", "/tools", "-xf", "/build/%s" % p.name])
-
     def install_artifact_archive(
         self, build_dir, package_name, target_triple, build_options
     ):
-        entry = DOWNLOADS[package_name]
-        basename = "%s-%s-%s-%s.tar" % (
-            package_name,
-            entry["version"],
-            target_triple,
-            build_options,
+        self.install_artifact_archives(
+            build_dir, [package_name], target_triple, build_options
         )
 
-        p = build_dir / basename
+    def install_artifact_archives(
+        self, build_dir, package_names, target_triple, build_options
+    ):
+        """Install multiple artifact archives into /tools.
+
+        Archives are copied into the container in a single transfer and
+        extracted concurrently, unless files of several archives collide, in
+        which case they are extracted in order.
+        """
+        paths = [
+            artifact_archive_path(build_dir, p, target_triple, build_options)
+            for p in package_names
+        ]
+        if not paths:
+            return
+
+        if len(paths) == 1:
+            self.extract_archive(paths[0])
+            return
+
+        collisions = archive_collisions(paths)
+        if collisions:
+            log_archive_collisions(collisions)
+
+        copy = [p for p in paths if not self.mounted_path(p)]
+        if copy:
+            with timed("copy_files", count=len(copy)) as t:
+                copy_files_to_container(copy, self.container, "/build")
+                t["bytes"] = sum(os.path.getsize(p) for p in copy)
+
+        archives = [self.mounted_path(p) or "/build/%s" % p.name for p in paths]
+
+        if collisions:
+            script = 'for a in "$@"; do tar -C /tools -xf "$a" || exit 1; done'
+        else:
+            script = (
+                'pids=; for a in "$@"; do tar -C /tools -xf "$a" & pids="$pids $!"; done; '
+                "rc=0; for p in $pids; do wait $p || rc=1; done; exit $rc"
+            )
+
+        self.run(["/bin/sh", "-c", script, "sh"] + archives)
+
+    def extract_archive(self, p: pathlib.Path):
+        """Extract a tar archive on the host into /tools."""
+        mounted = self.mounted_path(p)
+        if not mounted:
+            self.copy_file(p)
+            mounted = "/build/%s" % p.name
 
-        self.copy_file(p)
-        self.run(["/bin/tar", "-C", "/tools", "-xf", "/build/%s" % p.name])
+        self.run(["/bin/tar", "-C", "/tools", "-xf", mounted])
 
     def install_toolchain(
         self,
@@ -77,29 +258,37 @@ class ContainerContext(object):
         musl=False,
         clang=False,
     ):
-        if binutils:
-            self.install_toolchain_archive(build_dir, "binutils", host_platform)
-
-        if clang:
-            self.install_toolchain_archive(
-                build_dir, clang_toolchain(host_platform, target_triple), host_platform
-            )
-
-        if musl:
-            self.install_toolchain_archive(build_dir, "musl", host_platform)
+        for package_name in toolchain_packages(
+            host_platform, target_triple, binutils=binutils, musl=musl, clang=clang
+        ):
+            self.install_toolchain_archive(build_dir, package_name, host_platform)
 
     def run(self, program, user="build", environment=None):
         if isinstance(program, str) and not program.startswith("/"):
             program = "/build/%s" % program
 
-        container_exec(self.container, program, user=user, environment=environment)
+        with timed("run", program=str(program)):
+            container_exec(self.container, program, user=user, environment=environment)
 
     def get_tools_archive(self, dest, name):
         log("copying container files to %s" % dest)
-        data = container_get_archive(self.container, "/build/out/tools/%s" % name)
 
-        with open(dest, "wb") as fh:
-            fh.write(data)
+        dest = pathlib.Path(dest)
+        tmp = dest.with_name("%s.tmp%s" % (dest.name, random_suffix()))
+
+        with timed("get_tools_archive", dest=str(dest)) as t:
+            try:
+                with tmp.open("wb") as fh:
+                    container_write_archive(
+                        self.container, "/build/out/tools/%s" % name, fh
+                    )
+
+                os.replace(tmp, dest)
+            finally:
+                if tmp.exists():
+                    tmp.unlink()
+
+            t["bytes"] = dest.stat().st_size
 
     def get_file(self, path):
         log("retrieving container file %s" % path)
@@ -111,20 +300,18 @@ class ContainerContext(object):
 
         raise Exception("file not found")
 
-    def get_output_archive(self, path=None, as_tar=False):
-        p = "/build/out"
-        if path:
-            p += "/%s" % path
+    def write_output_archive(self, path, dest: pathlib.Path):
+        """Write a normalized archive of build output to a path."""
+        p = "/build/out/%s" % path
 
-        data = container_get_archive(self.container, p)
-        data = io.BytesIO(data)
+        with timed("write_output_archive", path=p) as t:
+            with tempfile.TemporaryFile() as fh:
+                container_write_archive(self.container, p, fh)
+                fh.seek(0)
 
-        data = normalize_tar_archive(data)
+                write_normalized_tar_archive(fh, dest)
 
-        if as_tar:
-            return tarfile.open(fileobj=data)
-        else:
-            return data.getvalue()
+            t["bytes"] = dest.stat().st_size
 
     def find_output_files(self, base_path, pattern):
         command = ["/usr/bin/find", "/build/out/%s" % base_path, "-name", pattern]
@@ -136,6 +323,23 @@ class ContainerContext(object):
             yield line[len("/build/out/%s/" % base_path) :].decode("ascii")
 
 
+def ensure_private_directory(path: pathlib.Path):
+    """Ensure a directory exists and is only accessible by the current user.
+
+    Raises if the directory exists but is owned or writable by somebody else.
+    """
+    try:
+        path.mkdir(mode=0o700)
+    except FileExistsError:
+        pass
+
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise Exception(
+            "refusing to use %s: not a directory private to the current user" % path
+        )
+
+
 class TempdirContext(object):
     def __init__(self, td):
         self.td = pathlib.Path(td)
@@ -156,58 +360,114 @@ class TempdirContext(object):
 
         dest_name = dest_name or source.name
         log("copying %s to %s/%s" % (source, dest_dir, dest_name))
-        shutil.copy(source, dest_dir / dest_name)
+
+        with timed("copy_file", source=str(source)) as t:
+            shutil.copy(source, dest_dir / dest_name)
+            t["bytes"] = os.path.getsize(source)
+
+    def copy_directory(self, source: pathlib.Path, dest_name, exclude=()):
+        """Copy a directory to <dest_name> in the temporary directory, replacing it.
+
+        Files are reflinked if the filesystem supports it. They are never
+        hardlinked since builds may modify them.
+        """
+        dest = self.td / dest_name
+        if dest.exists():
+            shutil.rmtree(dest)
+
+        log("copying %s to %s" % (source, dest))
+        with timed("copy_directory", source=str(source)):
+            populate_directory(source, dest, hardlink=False, exclude=exclude)
 
     def install_toolchain_archive(
         self, build_dir, package_name, host_platform, version=None
     ):
-        entry = DOWNLOADS[package_name]
-        basename = "%s-%s-%s.tar" % (
-            package_name,
-            version or entry["version"],
-            host_platform,
-        )
-
-        p = build_dir / basename
-        dest_path = self.td / "tools"
-        log("extracting %s to %s" % (p, dest_path))
-        extract_tar_to_directory(p, dest_path)
+        p = toolchain_archive_path(build_dir, package_name, host_platform, version)
+        self.extract_archive(p, build_dir)
 
     def install_artifact_archive(
         self, build_dir, package_name, target_triple, build_options
     ):
-        entry = DOWNLOADS[package_name]
-        basename = "%s-%s-%s-%s.tar" % (
-            package_name,
-            entry["version"],
-            target_triple,
-            build_options,
+        self.install_artifact_archives(
+            build_dir, [package_name], target_triple, build_options
         )
 
-        p = build_dir / basename
+    def install_artifact_archives(
+        self, build_dir, package_names, target_triple, build_options
+    ):
+        """Install multiple artifact archives into the tools directory.
+
+        Archives are extracted concurrently, unless files of several archives
+        collide, in which case they are extracted in order.
+        """
+        paths = [
+            artifact_archive_path(build_dir, p, target_triple, build_options)
+            for p in package_names
+        ]
+        if not paths:
+            return
+
+        collisions = archive_collisions(paths) if len(paths) > 1 else {}
+        if collisions:
+            log_archive_collisions(collisions)
+
+            for p in paths:
+                self.extract_archive(p, build_dir)
+
+            return
+
+        # Hash serially: the integrity index isn't safe for concurrent use.
+        index = IntegrityIndex(build_dir / ".integrity-index.json")
+        digests = {p: hash_path_indexed(p, index) for p in paths}
+
+        jobs = min(len(paths), os.cpu_count() or 1)
+
+        with concurrent.futures.ThreadPoolExecutor(jobs) as e:
+            fs = [
+                e.submit(self.extract_archive, p, build_dir, sha256=digests[p])
+                for p in paths
+            ]
+
+            for f in fs:
+                f.result()
+
+    def extract_archive(self, p: pathlib.Path, build_dir, sha256=None):
+        """Extract an archive into the tools directory.
+
+        Archives are extracted once into a per-user cache next to the
+        temporary directory (or in ``PYBUILD_EXTRACT_CACHE``) and their files
+        are reflinked or hardlinked from there.
+        """
         dest_path = self.td / "tools"
+        if "PYBUILD_EXTRACT_CACHE" in os.environ:
+            cache_dir = pathlib.Path(os.environ["PYBUILD_EXTRACT_CACHE"])
+        else:
+            # The temporary directory is typically shared with other users,
+            # who mustn't be able to plant content in the cache.
+            cache_dir = self.td.parent / ("pybuild-extracted-%d" % os.getuid())
+            ensure_private_directory(cache_dir)
+
+        if sha256 is None:
+            index = IntegrityIndex(build_dir / ".integrity-index.json")
+            sha256 = hash_path_indexed(p, index)
+
         log("extracting %s to %s" % (p, dest_path))
-        extract_tar_to_directory(p, dest_path)
+        with timed("extract_archive", archive=p.name):
+            extract_tar_to_directory_cached(p, dest_path, cache_dir, sha256)
 
     def install_toolchain(
         self,
         build_dir,
-        platform,
+        host_platform,
         target_triple,
         binutils=False,
         musl=False,
         clang=False,
     ):
-        if binutils:
-            self.install_toolchain_archive(build_dir, "binutils", platform)
-
-        if clang:
-            self.install_toolchain_archive(
-                build_dir, clang_toolchain(platform, target_triple), platform
-            )
-
-        if musl:
-            self.install_toolchain_archive(build_dir, "musl", platform)
+        for package_name in toolchain_packages(
+            host_platform, target_triple, binutils=binutils, musl=musl, clang=clang
+        ):
+            self.install_toolchain_archive(build_dir, package_name, host_platform)
 
     def run(self, program, user="build", environment=None):
         if user != "build":
@@ -216,13 +476,17 @@ class TempdirContext(object):
         if isinstance(program, str) and not program.startswith("/"):
             program = str(self.td / program)
 
-        exec_and_log(program, cwd=self.td, env=environment)
+        with timed("run", program=str(program)):
+            exec_and_log(program, cwd=self.td, env=environment)
 
     def get_tools_archive(self, dest, name):
         log("copying built files to %s" % dest)
 
-        with dest.open("wb") as fh:
-            create_tar_from_directory(fh, self.td / "out" / "tools")
+        with timed("get_tools_archive", dest=str(dest)) as t:
+            with dest.open("wb") as fh:
+                create_tar_from_directory(fh, self.td / "out" / "tools")
+
+            t["bytes"] = dest.stat().st_size
 
     def get_file(self, path):
         log("retrieving file %s" % path)
@@ -231,19 +495,16 @@ class TempdirContext(object):
         with p.open("rb") as fh:
             return fh.read()
 
-    def get_output_archive(self, path, as_tar=False):
+    def write_output_archive(self, path, dest: pathlib.Path):
+        """Write a normalized archive of build output to a path."""
         p = self.td / "out" / path
 
-        data = io.BytesIO()
-        create_tar_from_directory(data, p, path_prefix=p.parts[-1])
-        data.seek(0)
-
-        data = normalize_tar_archive(data)
+        with timed("write_output_archive", path=str(p)) as t:
+            write_normalized_tar_from_directory_to_path(
+                p, dest, path_prefix=p.parts[-1]
+            )
 
-        if as_tar:
-            return tarfile.open(fileobj=data)
-        else:
-            return data.getvalue()
+            t["bytes"] = dest.stat().st_size
 
     def find_output_files(self, base_path, pattern):
         base = str(self.td / "out" / base_path)
@@ -257,24 +518,207 @@ class TempdirContext(object):
                     yield full[len(base) + 1 :]
 
 
+def toolchain_image(
+    client,
+    image,
+    build_dir,
+    host_platform,
+    target_triple,
+    binutils=False,
+    musl=False,
+    clang=False,
+):
+    """Obtain a Docker image derived from another with a toolchain installed.
+
+    Images are keyed by the base image and the content of the toolchain
+    archives, so the toolchain is only copied and extracted once rather than
+    in every build environment.
+    """
+    packages = toolchain_packages(
+        host_platform, target_triple, binutils=binutils, musl=musl, clang=clang
+    )
+    archives = [toolchain_archive_path(build_dir, p, host_platform) for p in packages]
+
+    index = IntegrityIndex(build_dir / ".integrity-index.json")
+
+    key = artifact_cache_key(
+        {
+            "image": image,
+            "toolchain": [(a.name, hash_path_indexed(a, index)) for a in archives],
+        }
+    )[0:32]
+    tag = "%s:%s" % (TOOLCHAIN_IMAGE_REPOSITORY, key)
+
+    with exclusive_lock(build_dir / ("image-toolchain-%s.lock" % key)):
+        try:
+            return client.images.get(tag).id
+        except docker.errors.ImageNotFound:
+            pass
+
+        log("creating image %s with %s" % (tag, ", ".join(packages)))
+
+        bind_mount = docker_bind_mount()
+        container = start_container(client, image, bind_mount=bind_mount)
+        try:
+            context = ContainerContext(container, bind_mount=bind_mount)
+            context.install_toolchain(
+                build_dir,
+                host_platform,
+                target_triple,
+                binutils=binutils,
+                musl=musl,
+                clang=clang,
+            )
+            context.run(
+                ["/bin/rm", "-f"] + ["/build/%s" % a.name for a in archives],
+                user="root",
+            )
+
+            return container.commit(repository=TOOLCHAIN_IMAGE_REPOSITORY, tag=key).id
+        finally:
+            container.stop(timeout=0)
+            container.remove()
+
+
 @contextlib.contextmanager
-def build_environment(client, image):
-    if client is not None:
-        container = client.containers.run(
-            image, command=["/bin/sleep", "86400"], detach=True
-        )
-        td = None
-        context = ContainerContext(container)
-    else:
-        container = None
-        td = tempfile.TemporaryDirectory()
-        context = TempdirContext(td.name)
+def build_environment(client, image, toolchain=None):
+    """Create an environment to perform a build in.
+
+    ``toolchain`` holds the keyword arguments of ``install_toolchain()`` to
+    install a toolchain into the environment. In Docker, this uses an image
+    with the toolchain already installed.
+    """
+    with timed("build_environment_setup"):
+        if client is not None:
+            if toolchain:
+                image = toolchain_image(client, image, **toolchain)
+
+            bind_mount = docker_bind_mount()
+            pool_path = container_pool_path()
+
+            if pool_path:
+                container, pool_fh = acquire_pooled_container(
+                    client, pool_path, image, bind_mount=bind_mount
+                )
+            else:
+                container = start_container(client, image, bind_mount=bind_mount)
+
+            td = None
+            context = ContainerContext(container, bind_mount=bind_mount)
+        else:
+            container = None
+            pool_path = None
+            td = tempfile.TemporaryDirectory()
+            context = TempdirContext(td.name)
+
+            if toolchain:
+                context.install_toolchain(**toolchain)
 
     try:
         yield context
     finally:
-        if container:
-            container.stop(timeout=0)
-            container.remove()
+        with timed("build_environment_teardown"):
+            if container and pool_path:
+                release_pooled_container(container, pool_fh)
+            elif container:
+                container.stop(timeout=0)
+                container.remove()
+            else:
+                td.cleanup()
+
+
+# Label identifying the persistent containers of incremental builds.
+INCREMENTAL_LABEL = "pybuild.incremental"
+
+
+def incremental_build_path():
+    """Directory holding persistent build environments, if enabled."""
+    p = os.environ.get("PYBUILD_INCREMENTAL")
+
+    return pathlib.Path(p) if p else None
+
+
+@contextlib.contextmanager
+def persistent_build_environment(client, image, path, key, install, toolchain=None):
+    """Obtain a build environment which persists across builds.
+
+    ``path`` is a host directory holding the state of the environment. The
+    environment of a previous build is reused if it was populated from the
+    same image and ``key``. Otherwise it is discarded and a new environment is
+    created, ``toolchain`` is installed into it and ``install(context)`` is
+    called to install everything else.
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    state_path = path / "state.json"
+
+    try:
+        with state_path.open("r") as fh:
+            previous = json.load(fh)
+    except FileNotFoundError:
+        previous = {}
+
+    with timed("build_environment_setup", incremental=True):
+        if client is not None:
+            if toolchain:
+                image = toolchain_image(client, image, **toolchain)
+
+            bind_mount = docker_bind_mount()
+            state = {
+                "key": key,
+                "image": image,
+                "bind_mount": str(bind_mount or ""),
+            }
+
+            container = None
+            label = "%s=%s" % (INCREMENTAL_LABEL, path.resolve())
+            for c in client.containers.list(all=True, filters={"label": label}):
+                if (
+                    container is None
+                    and c.id == previous.get("container")
+                    and all(previous.get(k) == v for k, v in state.items())
+                ):
+                    container = c
+                else:
+                    log("discarding container %s" % c.short_id)
+                    c.remove(force=True)
+
+            reuse = container is not None
+            if not reuse:
+                container = start_container(
+                    client,
+                    image,
+                    bind_mount=bind_mount,
+                    labels={INCREMENTAL_LABEL: str(path.resolve())},
+                )
+            elif container.status != "running":
+                container.start()
+
+            state["container"] = container.id
+            context = ContainerContext(container, bind_mount=bind_mount)
+        else:
+            td = path / "build"
+            state = {"key": key, "image": None}
+
+            reuse = td.exists() and previous == state
+            if not reuse and td.exists():
+                shutil.rmtree(td)
+
+            td.mkdir(exist_ok=True)
+            context = TempdirContext(td)
+
+        if reuse:
+            log("reusing build environment in %s" % path)
         else:
-            td.cleanup()
+            # Never reuse an environment whose installation was interrupted.
+            if state_path.exists():
+                state_path.unlink()
+
+            if toolchain and client is None:
+                context.install_toolchain(**toolchain)
+
+            install(context)
+
+            with state_path.open("w") as fh:
+                json.dump(state, fh, sort_keys=True, indent=4)
+
+    yield context
@@ -2,14 +2,17 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
+import os
 import pathlib
 import re
+import shutil
 import tarfile
 
 import jsonschema
 import yaml
 
 from pythonbuild.logging import log
+from pythonbuild.utils import random_suffix
 
 EXTENSION_MODULE_SCHEMA = {
     "type": "object",
@@ -223,13 +226,111 @@ def meets_python_maximum_version(got: str, wanted: str) -> bool:
     return (got_major, got_minor) <= (wanted_major, wanted_minor)
 
 
+# Files of the CPython source distribution parsed by derive_setup_local().
+SETUP_SOURCE_FILES = (
+    "Modules/Setup",
+    "Modules/Setup.bootstrap.in",
+    "Modules/config.c.in",
+)
+
+# The subset of SETUP_SOURCE_FILES every CPython version has.
+# Modules/Setup.bootstrap.in only exists in 3.11+.
+REQUIRED_SETUP_SOURCE_FILES = (
+    "Modules/Setup",
+    "Modules/config.c.in",
+)
+
+
+def read_source_files(source: pathlib.Path, python_version, names):
+    """Read files from a CPython source archive or source directory.
+
+    Archives are decompressed in a single pass, stopping once all files were
+    found. Returns a dict of the content of the files which exist.
+    """
+    res = {}
+
+    if source.is_dir():
+        for name in names:
+            try:
+                res[name] = (source / name).read_bytes()
+            except FileNotFoundError:
+                pass
+
+        return res
+
+    prefix = "Python-%s/" % python_version
+    wanted = set(names)
+
+    with tarfile.open(str(source), "r|*") as tf:
+        for ti in tf:
+            name = ti.name[len(prefix) :]
+            if ti.name.startswith(prefix) and name in wanted and ti.isfile():
+                fh = tf.extractfile(ti)
+                # Regular files always have content to extract.
+                assert fh is not None
+                res[name] = fh.read()
+
+                if len(res) == len(wanted):
+                    break
+
+    return res
+
+
+def setup_source_path(
+    source_archive: pathlib.Path, python_version, cache_dir: pathlib.Path, sha256
+):
+    """Obtain a directory holding the files derive_setup_local() parses.
+
+    The files are extracted from the source archive once into
+    ``cache_dir/<sha256>``. Later builds read them from there instead of
+    decompressing the archive again.
+    """
+    dest = cache_dir / sha256
+
+    if dest.is_dir():
+        return dest
+
+    log("extracting %s from %s" % (", ".join(SETUP_SOURCE_FILES), source_archive))
+    files = read_source_files(source_archive, python_version, SETUP_SOURCE_FILES)
+
+    # Don't cache an incomplete directory (e.g. if the archive's top-level
+    # directory doesn't match the Python version), as every later build would
+    # then fail to derive Setup.local.
+    missing = [name for name in REQUIRED_SETUP_SOURCE_FILES if name not in files]
+    if missing:
+        raise Exception(
+            "%s not found under Python-%s/ in %s"
+            % (", ".join(missing), python_version, source_archive)
+        )
+
+    tmp = cache_dir / ("%s.tmp%s" % (sha256, random_suffix()))
+    tmp.mkdir(parents=True)
+
+    for name, data in files.items():
+        p = tmp / name
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_bytes(data)
+
+    try:
+        os.rename(tmp, dest)
+    except OSError:
+        # Another process populated the cache first.
+        shutil.rmtree(tmp)
+
+    return dest
+
+
 def derive_setup_local(
-    cpython_source_archive,
+    cpython_source,
     python_version,
     target_triple,
     extension_modules,
 ):
-    """Derive the content of the Modules/Setup.local file."""
+    """Derive the content of the Modules/Setup.local file.
+
+    ``cpython_source`` is a source archive or a directory with the files in
+    ``SETUP_SOURCE_FILES``, such as a source checkout or ``setup_source_path()``.
+    """
 
     # The first part of this function validates that our extension modules YAML
     # based metadata is in sync with the various files declaring extension
@@ -287,18 +388,14 @@ def derive_setup_local(
 
     # Parse more files in the distribution for their metadata.
 
-    with tarfile.open(str(cpython_source_archive)) as tf:
-        ifh = tf.extractfile("Python-%s/Modules/Setup" % python_version)
-        setup_lines = ifh.readlines()
-
-        try:
-            ifh = tf.extractfile(f"Python-{python_version}/Modules/Setup.bootstrap.in")
-            setup_bootstrap_in = ifh.readlines()
-        except KeyError:
-            setup_bootstrap_in = []
+    source_files = read_source_files(
+        pathlib.Path(cpython_source), python_version, SETUP_SOURCE_FILES
+    )
 
-        ifh = tf.extractfile("Python-%s/Modules/config.c.in" % python_version)
-        config_c_in = ifh.read()
+    setup_lines = source_files["Modules/Setup"].splitlines(keepends=True)
+    setup_bootstrap_in = source_files.get("Modules/Setup.bootstrap.in", b"")
+    setup_bootstrap_in = setup_bootstrap_in.splitlines(keepends=True)
+    config_c_in = source_files["Modules/config.c.in"]
 
     dist_modules = set()
     setup_enabled_actual = set()
@@ -3,17 +3,26 @@
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 import contextlib
+import hashlib
 import io
 import operator
 import os
 import pathlib
 import tarfile
+import tempfile
+import time
 
 import docker  # type: ignore
 import jinja2
 
-from .logging import log, log_raw
-from .utils import write_if_different
+from .logging import flush_log, log, log_output
+from .utils import (
+    lock_file,
+    random_suffix,
+    tar_members_from_directory,
+    write_if_different,
+    write_tar_members,
+)
 
 
 def write_dockerfiles(source_dir: pathlib.Path, dest_dir: pathlib.Path):
@@ -29,21 +38,43 @@ def write_dockerfiles(source_dir: pathlib.Path, dest_dir: pathlib.Path):
         write_if_different(dest_dir / f, data.encode("utf-8"))
 
 
+# Label recording the SHA256 of the Dockerfile an image was built from.
+DOCKERFILE_LABEL = "pybuild.dockerfile-sha256"
+
+
 def build_docker_image(client, image_data: bytes, image_dir: pathlib.Path, name):
     image_path = image_dir / ("image-%s" % name)
 
-    return ensure_docker_image(client, io.BytesIO(image_data), image_path=image_path)
+    # Images are keyed by the content of their Dockerfile, so an unchanged
+    # Dockerfile never needs to be built again.
+    dockerfile_sha256 = hashlib.sha256(image_data).hexdigest()
+
+    images = client.images.list(
+        filters={"label": "%s=%s" % (DOCKERFILE_LABEL, dockerfile_sha256)}
+    )
+    if images:
+        image = max(images, key=lambda i: i.attrs["Created"]).id
+        log("reusing image %s built from identical Dockerfile" % image)
+        save_docker_image(client, image, image_path)
+
+        return image
+
+    return ensure_docker_image(
+        client,
+        io.BytesIO(image_data),
+        image_path=image_path,
+        labels={DOCKERFILE_LABEL: dockerfile_sha256},
+    )
 
 
-def ensure_docker_image(client, fh, image_path=None):
-    res = client.api.build(fileobj=fh, decode=True)
+def ensure_docker_image(client, fh, image_path=None, labels=None):
+    res = client.api.build(fileobj=fh, decode=True, labels=labels)
 
     image = None
 
     for s in res:
         if "stream" in s:
-            for l in s["stream"].strip().splitlines():
-                log(l)
+            log_output(s["stream"].encode("utf-8"))
 
         if "aux" in s and "ID" in s["aux"]:
             image = s["aux"]["ID"]
@@ -52,23 +83,49 @@ def ensure_docker_image(client, fh, image_path=None):
         raise Exception("unable to determine built Docker image")
 
     if image_path:
-        tar_path = pathlib.Path(str(image_path) + ".tar")
-        with tar_path.open("wb") as fh:
-            for chunk in client.images.get(image).save():
-                fh.write(chunk)
-
-        with image_path.open("w") as fh:
-            fh.write(image + "\n")
+        save_docker_image(client, image, image_path)
 
     return image
 
 
+def save_docker_image(client, image, image_path: pathlib.Path):
+    """Record an image ID and save the image to ``<image_path>.tar``.
+
+    Saving is skipped if the tarball already holds this image.
+    """
+    tar_path = pathlib.Path(str(image_path) + ".tar")
+
+    try:
+        with image_path.open("r") as fh:
+            previous = fh.read().strip()
+    except FileNotFoundError:
+        previous = None
+
+    if previous == image and tar_path.exists():
+        log("%s already contains %s" % (tar_path, image))
+        # make compares the tarball's mtime against the Dockerfile's.
+        tar_path.touch()
+    else:
+        tmp = tar_path.with_name("%s.tmp%s" % (tar_path.name, random_suffix()))
+        try:
+            with tmp.open("wb") as fh:
+                for chunk in client.images.get(image).save():
+                    fh.write(chunk)
+
+            os.replace(tmp, tar_path)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+
+    write_if_different(image_path, ("%s\n" % image).encode("ascii"))
+
+
 def get_image(client, source_dir: pathlib.Path, image_dir: pathlib.Path, name):
     if client is None:
         return None
 
     image_path = image_dir / ("image-%s" % name)
-    tar_path = image_path.with_suffix(".tar")
+    tar_path = pathlib.Path(str(image_path) + ".tar")
 
     with image_path.open("r") as fh:
         image_id = fh.read().strip()
@@ -78,9 +135,10 @@ def get_image(client, source_dir: pathlib.Path, image_dir: pathlib.Path, name):
         return image_id
     except docker.errors.ImageNotFound:
         if tar_path.exists():
+            # Stream the tarball to the daemon rather than reading it into
+            # memory.
             with tar_path.open("rb") as fh:
-                data = fh.read()
-            client.images.load(data)
+                client.images.load(fh)
 
             return image_id
 
@@ -101,11 +159,211 @@ def copy_file_to_container(path, container, container_path, archive_path=None):
     container.put_archive(container_path, buf.getvalue())
 
 
-@contextlib.contextmanager
-def run_container(client, image):
-    container = client.containers.run(
-        image, command=["/bin/sleep", "86400"], detach=True
+def copy_files_to_container(paths, container, container_path):
+    """Copy multiple files on the local filesystem to a running container.
+
+    The files are transferred in a single archive, which is spooled to a
+    temporary file rather than held in memory.
+    """
+    with tempfile.TemporaryFile() as fh:
+        with tarfile.open(fileobj=fh, mode="w") as tf:
+            for path in paths:
+                tf.add(str(path), path.name)
+
+        fh.seek(0)
+
+        log(
+            "copying %s to container:%s"
+            % (", ".join(path.name for path in paths), container_path)
+        )
+        container.put_archive(container_path, fh)
+
+
+def copy_directory_to_container(path, container, container_path, dest_name, exclude=()):
+    """Copy a directory on the local filesystem to a running container.
+
+    Modification times are preserved. Entries matching ``exclude`` (see
+    ``path_excluded()``) aren't copied.
+    """
+    with tempfile.TemporaryFile(buffering=0) as fh:
+        write_tar_members(
+            fh,
+            tar_members_from_directory(
+                path, path_prefix=dest_name, normalize=False, exclude=exclude
+            ),
+        )
+        size = fh.tell()
+        fh.seek(0)
+
+        log("copying %s to container:%s/%s" % (path, container_path, dest_name))
+        container.put_archive(container_path, fh)
+
+    return size
+
+
+# Where the directory from ``PYBUILD_DOCKER_BIND_MOUNT`` is mounted in containers.
+BIND_MOUNT_PATH = "/inputs"
+
+
+def docker_bind_mount():
+    """Host directory to bind mount read-only into build containers, if any.
+
+    Files in it are referenced by build containers instead of being copied
+    into them. This requires the Docker daemon to run on the local machine.
+    """
+    p = os.environ.get("PYBUILD_DOCKER_BIND_MOUNT")
+
+    return pathlib.Path(os.path.realpath(p)) if p else None
+
+
+def start_container(client, image, bind_mount=None, labels=None):
+    """Start a long-running container to execute commands in."""
+    volumes = {}
+    if bind_mount:
+        volumes[str(bind_mount)] = {"bind": BIND_MOUNT_PATH, "mode": "ro"}
+
+    return client.containers.run(
+        image,
+        command=["/bin/sleep", "86400"],
+        detach=True,
+        volumes=volumes,
+        labels=labels or {},
+    )
+
+
+# Label identifying containers of the warm container pool.
+POOL_LABEL = "pybuild.pool"
+
+
+def container_pool_path():
+    """Directory coordinating the warm container pool, if it is enabled."""
+    p = os.environ.get("PYBUILD_CONTAINER_POOL")
+
+    return pathlib.Path(p) if p else None
+
+
+def acquire_pooled_container(client, pool_path: pathlib.Path, image, bind_mount=None):
+    """Obtain an idle container of an image from the warm container pool.
+
+    A new container is started if none are idle. Containers are claimed by
+    holding a lock on a file named after them in ``pool_path``, so concurrent
+    ``build.py`` processes never share a container.
+
+    Reused containers are reset when they are claimed rather than when they
+    are released, since a ``build.py`` process which was killed never
+    released its container.
+
+    Returns the container and the open lock file, to be handed back to
+    ``release_pooled_container()``.
+    """
+    labels = {
+        POOL_LABEL: "1",
+        "%s.image" % POOL_LABEL: image,
+        "%s.bind_mount" % POOL_LABEL: str(bind_mount or ""),
+    }
+
+    pool_path.mkdir(parents=True, exist_ok=True)
+
+    def claim(container):
+        fh = (pool_path / ("%s.lock" % container.id)).open("a")
+        if lock_file(fh):
+            return fh
+
+        fh.close()
+        return None
+
+    while True:
+        for container in client.containers.list(
+            filters={
+                "label": ["%s=%s" % (k, v) for k, v in sorted(labels.items())],
+                "status": "running",
+            }
+        ):
+            fh = claim(container)
+            if not fh:
+                continue
+
+            if reset_pooled_container(container):
+                log("reusing container %s" % container.short_id)
+                return container, fh
+
+            log("discarding container %s" % container.short_id)
+            try:
+                container.stop(timeout=0)
+                container.remove()
+            finally:
+                fh.close()
+
+        container = start_container(client, image, bind_mount=bind_mount, labels=labels)
+
+        # Another process may have found and claimed the new container before
+        # us, in which case we look again.
+        fh = claim(container)
+        if fh:
+            return container, fh
+
+
+# Kills every process of a container but its init process and the shell
+# running this. There may be none.
+KILL_PROCESSES_SCRIPT = "kill -KILL -1 2>/dev/null || true"
+
+
+def reset_pooled_container(container):
+    """Reset a container of the pool to the state of its image.
+
+    Processes left behind by the previous build are killed and paths it
+    added are removed. Returns False if the build modified or deleted files
+    of the image, in which case the container can't be reset.
+    """
+    container.exec_run(["/bin/sh", "-c", KILL_PROCESSES_SCRIPT], user="root")
+
+    changes = container.diff() or []
+
+    if any(c["Kind"] == 2 for c in changes):
+        return False
+
+    added = {
+        c["Path"]
+        for c in changes
+        if c["Kind"] == 1
+        and c["Path"] != BIND_MOUNT_PATH
+        and not c["Path"].startswith("%s/" % BIND_MOUNT_PATH)
+    }
+    # Only remove the top-most added paths.
+    remove = sorted(p for p in added if os.path.dirname(p) not in added)
+    modified = sorted(c["Path"] for c in changes if c["Kind"] == 0)
+
+    # Modified directories are fine: that's how added paths show up.
+    script = (
+        'for p in "$@"; do '
+        'if [ "$p" = -- ]; then break; fi; '
+        '[ -d "$p" ] || exit 1; shift; '
+        'done; shift; rm -rf -- "$@"'
     )
+    res = container.exec_run(
+        ["/bin/sh", "-c", script, "sh"] + modified + ["--"] + remove,
+        user="root",
+    )
+
+    return res.exit_code == 0
+
+
+def release_pooled_container(container, fh):
+    """Return a container to the pool.
+
+    Background processes started by the build (e.g. an sccache server) are
+    killed so idle containers don't keep running them. Files are cleaned up
+    by the next ``acquire_pooled_container()`` claiming the container.
+    """
+    try:
+        container.exec_run(["/bin/sh", "-c", KILL_PROCESSES_SCRIPT], user="root")
+    finally:
+        fh.close()
+
+
+@contextlib.contextmanager
+def run_container(client, image, bind_mount=None):
+    container = start_container(client, image, bind_mount=bind_mount)
     try:
         yield container
     finally:
@@ -123,15 +381,13 @@ def container_exec(container, command, user="build", environment=None):
     exec_output = container.client.api.exec_start(create_res["Id"], stream=True)
 
     for chunk in exec_output:
-        for l in chunk.strip().splitlines():
-            log(l)
-
-        log_raw(chunk)
+        log_output(chunk)
 
     inspect_res = container.client.api.exec_inspect(create_res["Id"])
 
     if inspect_res["ExitCode"] != 0:
         if "PYBUILD_BREAK_ON_FAILURE" in os.environ:
+            flush_log()
             print("to enter container: docker exec -it %s /bin/bash" % container.id)
             import pdb
 
@@ -146,21 +402,47 @@ DEFAULT_MTIME = 1546329600
 
 def container_get_archive(container, path):
     """Get a deterministic tar archive from a container."""
-    data, stat = container.get_archive(path)
-    old_data = io.BytesIO()
-    for chunk in data:
-        old_data.write(chunk)
+    data = io.BytesIO()
+    container_write_archive(container, path, data)
+
+    return data.getvalue()
+
 
-    old_data.seek(0)
+def container_write_archive(container, path, fh):
+    """Write a deterministic tar archive of a container path to a file object.
 
-    new_data = io.BytesIO()
+    The archive from Docker is spooled to a temporary file and members are
+    written in sorted order from an index of it, so memory use is bounded
+    regardless of the archive size.
+    """
+    start = time.monotonic()
 
-    with tarfile.open(fileobj=old_data) as itf, tarfile.open(
-        fileobj=new_data, mode="w"
-    ) as otf:
-        for member in sorted(itf.getmembers(), key=operator.attrgetter("name")):
-            file_data = itf.extractfile(member) if not member.linkname else None
-            member.mtime = DEFAULT_MTIME
-            otf.addfile(member, file_data)
+    data, stat = container.get_archive(path)
+
+    with tempfile.TemporaryFile() as spool:
+        size = 0
+        for chunk in data:
+            spool.write(chunk)
+            size += len(chunk)
+
+        spool.seek(0)
+
+        with tarfile.open(fileobj=spool) as itf:
+            with tarfile.open(fileobj=fh, mode="w") as otf:
+                for member in sorted(itf.getmembers(), key=operator.attrgetter("name")):
+                    file_data = itf.extractfile(member) if not member.linkname else None
+                    member.mtime = DEFAULT_MTIME
+                    otf.addfile(member, file_data)
+
+    duration = time.monotonic() - start
+    log(
+        "retrieved %s from container: %.1f MiB in %.1fs (%.1f MiB/s)"
+        % (
+            path,
+            size / 1024**2,
+            duration,
+            size / 1024**2 / duration if duration else 0.0,
+        )
+    )
 
-    return new_data.getvalue()
+    return size
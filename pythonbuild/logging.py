@@ -2,16 +2,217 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
+import collections
+import contextlib
+import json
+import os
+import queue
+import sys
+import threading
+import time
+import typing
+
+import zstandard
+
+# Verbosity levels of console output. Log files always receive everything.
+QUIET = 0
+# Messages about the progress of the build.
+PROGRESS = 1
+# Progress messages and the output of build commands.
+VERBOSE = 2
+
+VERBOSITY_LEVELS = {
+    "quiet": QUIET,
+    "progress": PROGRESS,
+    "verbose": VERBOSE,
+}
+
+# Maximum number of pending writes before producers block.
+LOG_QUEUE_SIZE = 1024
+# Number of output lines printed when a build fails without verbose output.
+LOG_TAIL_LINES = 100
+
 LOG_PREFIX = [None]
-LOG_FH = [None]
+LOG_WRITER: list[typing.Optional["LogWriter"]] = [None]
+TRACE_PATH = [None]
+TRACE_ARGS: list[dict[str, typing.Any]] = [{}]
+
+
+class LogWriter:
+    """Writes log data to a file and the console from a background thread.
+
+    Writes are queued, so producers aren't slowed down by I/O. Once
+    ``LOG_QUEUE_SIZE`` writes are pending, producers block until the
+    background thread catches up.
+
+    Console output is buffered until complete lines are available, which are
+    each prefixed with the name of the action. Lines are written to stdout in
+    batches with a single write, so output of concurrent builds sharing a
+    console doesn't interleave within lines.
+    """
+
+    def __init__(self, prefix, fh, verbosity=VERBOSE, compress=False):
+        self.prefix = ("%s> " % prefix).encode("utf-8")
+        self.fh = fh
+        self.verbosity = verbosity
+        self.compressor = (
+            zstandard.ZstdCompressor(level=3).compressobj() if compress else None
+        )
+        # The last lines of output, printed if the build fails.
+        self.tail = collections.deque(maxlen=LOG_TAIL_LINES)
+
+        self._queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        self._partial = b""
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name="log-writer")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def write(self, data: bytes, level):
+        self._raise_error()
+        self._queue.put((data, level))
+
+    def flush(self):
+        """Wait until all pending data is written."""
+        self._queue.join()
+        self._raise_error()
+
+    def close(self):
+        """Write all pending data and stop the background thread."""
+        self._queue.put(None)
+        self._thread.join()
+        self._raise_error()
+
+    def _raise_error(self):
+        # Errors of the background thread, e.g. from a full disk, are raised
+        # in the threads logging instead.
+        if self._error:
+            raise self._error
+
+    def _run(self):
+        while True:
+            items = [self._queue.get()]
+
+            # Process everything that is pending in one go.
+            while items[-1] is not None:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            count = len(items)
+
+            done = items[-1] is None
+            if done:
+                items.pop()
+
+            # After an error, the queue is still drained so producers never
+            # block on it.
+            try:
+                if not self._error:
+                    self._write(items, done)
+            except BaseException as e:
+                self._error = e
+            finally:
+                for _ in range(count):
+                    self._queue.task_done()
+
+            if done:
+                return
+
+    def _write(self, items, done):
+        console = []
+        data = []
+
+        def add_lines(lines, level):
+            for line in lines.split(b"\n"):
+                line = self.prefix + line.rstrip(b"\r") + b"\n"
+                self.tail.append(line)
+                if level <= self.verbosity:
+                    console.append(line)
 
+        def terminate_partial():
+            # Incomplete lines of output are terminated before anything else
+            # is logged.
+            if self._partial:
+                data.append(b"\n")
+                add_lines(self._partial, VERBOSE)
+                self._partial = b""
 
-def set_logger(prefix, fh):
-    LOG_PREFIX[0] = prefix
-    LOG_FH[0] = fh
+        for chunk, level in items:
+            # Only output of build commands can contain incomplete lines.
+            if level == VERBOSE:
+                data.append(chunk)
+                lines, newline, self._partial = (self._partial + chunk).rpartition(
+                    b"\n"
+                )
+                if newline:
+                    add_lines(lines, level)
+            else:
+                terminate_partial()
+                data.append(chunk)
+                add_lines(chunk.rstrip(b"\n"), level)
+
+        if done:
+            terminate_partial()
+
+        data = b"".join(data)
+        if self.compressor:
+            data = self.compressor.compress(data)
+            if done:
+                data += self.compressor.flush()
+
+        self.fh.write(data)
+        if done:
+            self.fh.flush()
+
+        if console:
+            # Don't overtake output printed without the writer.
+            sys.stdout.flush()
+            sys.stdout.buffer.write(b"".join(console))
+            sys.stdout.buffer.flush()
+
+
+@contextlib.contextmanager
+def log_to_file(prefix, path, verbosity=VERBOSE, compress=False):
+    """Log to a file for the duration of the context.
+
+    Output of build commands is only printed if ``verbosity`` is ``VERBOSE``.
+    If the context exits with an exception, the last lines of output are
+    printed so the cause of the failure is visible. With ``compress``, the
+    log file is zstd compressed.
+    """
+    with open(path, "wb") as fh:
+        writer = LogWriter(prefix, fh, verbosity=verbosity, compress=compress)
+        LOG_PREFIX[0] = prefix
+        LOG_WRITER[0] = writer
+
+        start = time.monotonic()
+        try:
+            yield writer
+        except BaseException:
+            try:
+                writer.close()
+            except Exception:
+                # The exception of the build is more relevant.
+                pass
+
+            if verbosity < VERBOSE and writer.tail:
+                sys.stdout.flush()
+                sys.stdout.buffer.write(b"".join(writer.tail))
+                sys.stdout.buffer.flush()
+            raise
+        else:
+            try:
+                log("finished in %.1fs" % (time.monotonic() - start))
+            finally:
+                writer.close()
+        finally:
+            LOG_WRITER[0] = None
 
 
 def log(msg):
+    """Log a message about the progress of the build."""
     if isinstance(msg, bytes):
         msg_str = msg.decode("utf-8", "replace")
         msg_bytes = msg
@@ -19,12 +220,82 @@ def log(msg):
         msg_str = msg
         msg_bytes = msg.encode("utf-8", "replace")
 
-    print("%s> %s" % (LOG_PREFIX[0], msg_str))
+    if LOG_WRITER[0]:
+        LOG_WRITER[0].write(msg_bytes + b"\n", PROGRESS)
+    else:
+        print("%s> %s" % (LOG_PREFIX[0], msg_str))
+
+
+def flush_log():
+    """Wait until everything logged so far is written."""
+    if LOG_WRITER[0]:
+        LOG_WRITER[0].flush()
+
+
+def log_output(data: bytes):
+    """Log a chunk of output of a build command.
+
+    Chunks don't need to end at line boundaries.
+    """
+    if LOG_WRITER[0]:
+        LOG_WRITER[0].write(data, VERBOSE)
+    else:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
+
+
+def set_tracer(path, process_name, **args):
+    """Record timing events to a trace file.
+
+    The trace file uses the Chrome trace event JSON array format, which
+    allows the closing bracket to be omitted. So multiple processes can
+    append events to the same file.
+    """
+    TRACE_PATH[0] = path
+    TRACE_ARGS[0] = args
+
+    if path:
+        write_trace_event(
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": os.getpid(),
+                "args": {"name": process_name},
+            }
+        )
+
+
+def write_trace_event(event):
+    # Events are written with a single append so concurrent writers don't
+    # interleave.
+    with open(TRACE_PATH[0], "a", encoding="utf-8") as fh:
+        fh.write(json.dumps(event, sort_keys=True) + ",\n")
+
 
-    if LOG_FH[0]:
-        LOG_FH[0].write(msg_bytes + b"\n")
+@contextlib.contextmanager
+def timed(name, category="build", **args):
+    """Record the duration of an operation in the trace.
 
+    The yielded dict holds the arguments attached to the event and can be
+    updated to record additional details, such as the number of bytes moved.
+    """
+    args = dict(TRACE_ARGS[0], **args)
 
-def log_raw(data):
-    if LOG_FH[0]:
-        LOG_FH[0].write(data)
+    start = time.time()
+    try:
+        yield args
+    finally:
+        if TRACE_PATH[0]:
+            write_trace_event(
+                {
+                    "name": name,
+                    "cat": category,
+                    "ph": "X",
+                    "ts": int(start * 1000000),
+                    "dur": int((time.time() - start) * 1000000),
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident(),
+                    "args": args,
+                }
+            )
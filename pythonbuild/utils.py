@@ -3,6 +3,10 @@
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 import collections
+import concurrent.futures
+import contextlib
+import fnmatch
+import glob
 import gzip
 import hashlib
 import http.client
@@ -13,12 +17,14 @@ import os
 import pathlib
 import platform
 import random
+import shutil
 import stat
 import string
 import subprocess
 import sys
 import tarfile
 import time
+import typing
 import urllib.error
 import urllib.request
 import zipfile
@@ -27,7 +33,7 @@ import yaml
 import zstandard
 
 from .downloads import DOWNLOADS
-from .logging import log
+from .logging import flush_log, log, log_output
 
 
 def get_targets(yaml_path: pathlib.Path):
@@ -69,6 +75,81 @@ def target_needs(yaml_path: pathlib.Path, target: str, python_version: str):
     return needs
 
 
+# Artifacts of other packages installed into the build environment of a
+# dependency package. ``cpython-unix/build.py`` installs these and
+# ``write_triples_makefiles()`` turns them into Makefile prerequisites.
+PACKAGE_EXTRA_ARCHIVES = {
+    "autoconf": {"m4"},
+    "libX11": {
+        "inputproto",
+        "kbproto",
+        "libpthread-stubs",
+        "libXau",
+        "libxcb",
+        "x11-util-macros",
+        "xextproto",
+        "xorgproto",
+        "xproto",
+        "xtrans",
+    },
+    "libXau": {"x11-util-macros", "xproto"},
+    "libedit": {"ncurses"},
+    "libxcb": {"libpthread-stubs", "libXau", "xcb-proto", "xproto"},
+    "tix": {"tcl", "tk"},
+    "tk": {"tcl"},
+}
+
+# Additional artifacts of packages built against X11, which isn't used on
+# macOS.
+PACKAGE_X11_ARCHIVES = {
+    "tix": {"libX11", "xorgproto"},
+    "tk": {"libX11", "libXau", "libxcb", "xcb-proto", "xorgproto"},
+}
+
+
+def package_extra_archives(package: str, host_platform: str) -> set[str]:
+    """Obtain the names of the artifacts needed to build a dependency package."""
+    archives = set(PACKAGE_EXTRA_ARCHIVES.get(package, ()))
+
+    if host_platform != "macos":
+        archives |= PACKAGE_X11_ARCHIVES.get(package, set())
+
+    return archives
+
+
+def target_downloads(
+    yaml_path: pathlib.Path,
+    target: str,
+    host_platform: str,
+    python_version: str,
+    python_entry=None,
+):
+    """Obtain the names of DOWNLOADS entries needed to build the specified target.
+
+    ``python_entry`` is the DOWNLOADS key of the CPython source archive. If
+    not defined (e.g. when building from a custom source checkout), no
+    CPython source archive is included.
+    """
+    pending = list(target_needs(yaml_path, target, python_version))
+    keys = set()
+
+    while pending:
+        key = pending.pop()
+        if key in keys:
+            continue
+
+        keys.add(key)
+        pending.extend(package_extra_archives(key, host_platform))
+
+    keys.add(clang_toolchain(host_platform, target))
+    keys |= {"pip", "setuptools"}
+
+    if python_entry:
+        keys.add(python_entry)
+
+    return keys
+
+
 def release_tag_from_git():
     return (
         subprocess.check_output(
@@ -122,7 +203,11 @@ def get_target_support_file(
 
 
 def write_if_different(p: pathlib.Path, data: bytes):
-    """Write a file if it is missing or its content is different."""
+    """Write a file if it is missing or its content is different.
+
+    The file is replaced atomically so concurrent builds never observe
+    partially written content.
+    """
     if p.exists():
         with p.open("rb") as fh:
             existing = fh.read()
@@ -131,9 +216,12 @@ def write_if_different(p: pathlib.Path, data: bytes):
         write = True
 
     if write:
-        with p.open("wb") as fh:
+        tmp = p.with_name("%s.tmp%s" % (p.name, random_suffix()))
+        with tmp.open("wb") as fh:
             fh.write(data)
 
+        os.replace(tmp, p)
+
 
 def write_triples_makefiles(
     targets, dest_dir: pathlib.Path, support_search_dir: pathlib.Path
@@ -173,6 +261,22 @@ def write_triples_makefiles(
                 % (support_search_dir / "extension-modules.yml")
             )
 
+            # Dependency packages are shared by all build option variants.
+            lines.append(
+                "DEPENDENCY_SUFFIX := %s-%s\n" % (triple, DEPENDENCY_BUILD_OPTIONS)
+            )
+
+            for package in sorted(PACKAGE_EXTRA_ARCHIVES):
+                archives = [
+                    "$(OUTDIR)/%s-$(%s_VERSION)-$(DEPENDENCY_SUFFIX).tar"
+                    % (p, p.upper().replace("-", "_"))
+                    for p in sorted(package_extra_archives(package, host_platform))
+                ]
+                lines.append(
+                    "%s_EXTRA_ARCHIVES = %s\n"
+                    % (package.upper().replace("-", "_"), " ".join(archives))
+                )
+
             write_if_different(makefile_path, "".join(lines).encode("ascii"))
 
 
@@ -186,6 +290,13 @@ def write_package_versions(dest_path: pathlib.Path):
         write_if_different(p, content.encode("ascii"))
 
 
+# Build options variant of dependency package artifacts. Dependency build
+# scripts don't read the build options, so their artifacts are shared by all
+# CPython build option variants. Emitted as DEPENDENCY_SUFFIX by
+# write_triples_makefiles().
+DEPENDENCY_BUILD_OPTIONS = "noopt"
+
+
 def write_cpython_version(dest_path: pathlib.Path, version: str):
     """Write a CPython version in a directory."""
     dest_path.mkdir(parents=True, exist_ok=True)
@@ -215,16 +326,61 @@ class IntegrityError(Exception):
     """Represents an integrity error when downloading a URL."""
 
 
-def secure_download_stream(url, size, sha256):
+def secure_download_stream(url, size, sha256, resume_from=None):
     """Securely download a URL to a stream of chunks.
 
+    If ``resume_from`` is the path of a partially downloaded file, its content
+    is hashed and only the remainder is requested via an HTTP Range request.
+    Only the chunks not already present in that file are yielded. If the file
+    is already complete, it is verified without making a request.
+
     If the integrity of the download fails, an IntegrityError is
-    raised.
+    raised. If the server closes the connection early, an
+    ``http.client.IncompleteRead`` is raised.
     """
     h = hashlib.sha256()
     length = 0
 
-    with urllib.request.urlopen(url) as fh:
+    if resume_from:
+        with resume_from.open("rb") as fh:
+            while True:
+                chunk = fh.read(65536)
+                if not chunk:
+                    break
+
+                h.update(chunk)
+                length += len(chunk)
+
+        if length > size:
+            raise IntegrityError("partial download of %s is larger than expected" % url)
+
+        # The download was complete after all. There's nothing to request.
+        if length == size:
+            if h.hexdigest() != sha256:
+                raise IntegrityError("partial download of %s is corrupt" % url)
+
+            return
+
+    req = urllib.request.Request(url)
+    if 0 < length < size:
+        req.add_header("Range", "bytes=%d-" % length)
+
+    # Number of bytes at the start of the response we already have.
+    skip = length
+
+    with urllib.request.urlopen(req) as fh:
+        if length and length < size and fh.status == 206:
+            content_range = fh.info().get("Content-Range", "")
+            if not content_range.startswith("bytes %d-" % length):
+                raise IntegrityError(
+                    "unexpected Content-Range resuming %s: %s" % (url, content_range)
+                )
+
+            if fh.info().get("Content-Encoding") == "gzip":
+                raise IntegrityError("cannot resume gzip encoded download of %s" % url)
+
+            skip = 0
+
         if not url.endswith(".gz") and fh.info().get("Content-Encoding") == "gzip":
             fh = gzip.GzipFile(fileobj=fh)
 
@@ -233,11 +389,24 @@ def secure_download_stream(url, size, sha256):
             if not chunk:
                 break
 
+            # The server ignored the Range request. Discard what we already
+            # have.
+            if skip:
+                discard = min(skip, len(chunk))
+                chunk = chunk[discard:]
+                skip -= discard
+
+                if not chunk:
+                    continue
+
             h.update(chunk)
             length += len(chunk)
 
             yield chunk
 
+    if length < size:
+        raise http.client.IncompleteRead(b"", size - length)
+
     digest = h.hexdigest()
 
     if length != size or digest != sha256:
@@ -247,64 +416,486 @@ def secure_download_stream(url, size, sha256):
         )
 
 
-def download_to_path(url: str, path: pathlib.Path, size: int, sha256: str):
-    """Download a URL to a filesystem path, possibly with verification."""
+def random_suffix() -> str:
+    return "".join(random.choices(string.ascii_uppercase + string.digits, k=8))
+
+
+class IntegrityIndex(object):
+    """A persistent record of verified file digests.
+
+    Entries are keyed by absolute path and are only trusted as long as the
+    size, mtime and inode of the file are unchanged, so repeat verification
+    of a large file is a ``stat()`` instead of a full read.
+
+    Updates hold a lock on a file next to the index, so concurrent writers
+    (e.g. prefetch threads) don't drop each other's entries.
+    """
+
+    def __init__(self, path: pathlib.Path):
+        self.path = path
+
+    def load(self):
+        try:
+            with self.path.open("rb") as fh:
+                return json.load(fh)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def save(self, data):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp = self.path.with_name("%s.tmp%s" % (self.path.name, random_suffix()))
+        with tmp.open("w") as fh:
+            json.dump(data, fh, indent=2, sort_keys=True)
+
+        os.replace(tmp, self.path)
+
+    def lock(self):
+        """Lock the index for a read-modify-write update."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        return exclusive_lock(self.path.with_name("%s.lock" % self.path.name))
+
+    def verified_sha256(self, path: pathlib.Path):
+        """Obtain the recorded digest of a path if it is still valid."""
+        entry = self.load().get(str(path.absolute()))
+        if not entry:
+            return None
+
+        st = path.stat()
+        if (entry["size"], entry["mtime_ns"], entry["inode"]) != (
+            st.st_size,
+            st.st_mtime_ns,
+            st.st_ino,
+        ):
+            return None
+
+        return entry["sha256"]
+
+    def record(self, path: pathlib.Path, sha256: str):
+        st = path.stat()
+
+        with self.lock():
+            data = self.load()
+            data[str(path.absolute())] = {
+                "inode": st.st_ino,
+                "last_used": time.time(),
+                "mtime_ns": st.st_mtime_ns,
+                "sha256": sha256,
+                "size": st.st_size,
+            }
+            self.save(data)
+
+
+def verify_path(path: pathlib.Path, size: int, sha256: str, index: IntegrityIndex):
+    """Verify the size and SHA-256 of a file, consulting an integrity index."""
+    if path.stat().st_size != size:
+        return False
+
+    if index.verified_sha256(path) == sha256:
+        return True
+
+    if hash_path(path) != sha256:
+        return False
+
+    index.record(path, sha256)
+
+    return True
+
+
+def hash_path_indexed(path: pathlib.Path, index: IntegrityIndex) -> str:
+    """Obtain the SHA-256 of a file, consulting an integrity index."""
+    digest: typing.Optional[str] = index.verified_sha256(path)
+
+    if digest is None:
+        digest = hash_path(path)
+        index.record(path, digest)
+
+    return digest
+
+
+def download_cache_root():
+    """Obtain the root directory of the shared download cache, if configured."""
+    if "PYBUILD_DOWNLOAD_CACHE" in os.environ:
+        return pathlib.Path(os.environ["PYBUILD_DOWNLOAD_CACHE"])
+
+    return None
+
+
+def download_cache_lock(root: pathlib.Path):
+    """Lock held while files in the download cache are used or evicted.
+
+    So a file can't be evicted between verifying it and linking it into a
+    checkout.
+    """
+    root.mkdir(parents=True, exist_ok=True)
+
+    return exclusive_lock(root / "lock")
+
+
+def evict_download_cache(root: pathlib.Path, index: IntegrityIndex, keep=None):
+    """Evict least recently used files from the download cache.
+
+    The cache size limit in bytes comes from ``PYBUILD_DOWNLOAD_CACHE_SIZE``.
+    Nothing is evicted if it isn't set. Must be called with
+    ``download_cache_lock()`` held.
+    """
+    if "PYBUILD_DOWNLOAD_CACHE_SIZE" not in os.environ:
+        return
+
+    max_size = int(os.environ["PYBUILD_DOWNLOAD_CACHE_SIZE"])
+
+    with index.lock():
+        data = index.load()
+
+        entries = []
+        total = 0
+        for p in (root / "sha256").glob("*/*"):
+            st = p.stat()
+
+            # Files still hardlinked elsewhere (e.g. into checkouts) don't take
+            # space of their own, so evicting them wouldn't free anything.
+            if st.st_nlink > 1:
+                continue
+
+            last_used = data.get(str(p.absolute()), {}).get("last_used", st.st_mtime)
+            entries.append((last_used, p, st.st_size))
+            total += st.st_size
+
+        for _, p, size in sorted(entries):
+            if total <= max_size:
+                break
+
+            if keep and p == keep:
+                continue
+
+            print("evicting %s from download cache" % p)
+            p.unlink(missing_ok=True)
+            data.pop(str(p.absolute()), None)
+            total -= size
+
+        # Drop entries for files that no longer exist.
+        for k in list(data):
+            if not os.path.exists(k):
+                del data[k]
+
+        index.save(data)
+
+
+def link_or_copy(source: pathlib.Path, dest: pathlib.Path):
+    """Materialize a file at a path using a hardlink, falling back to a copy."""
+    tmp = dest.with_name("%s.tmp%s" % (dest.name, random_suffix()))
+
+    try:
+        os.link(source, tmp)
+    except OSError:
+        shutil.copyfile(source, tmp)
+
+    os.replace(tmp, dest)
+
+
+def lock_file(fh) -> bool:
+    """Attempt to take an exclusive, non-blocking lock on an open file.
+
+    Returns False if the lock is held by somebody else or if locking isn't
+    supported on this platform.
+    """
+    try:
+        import fcntl
+    except ImportError:
+        return False
+
+    try:
+        fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+
+    return True
+
+
+def artifact_cache_root():
+    """Obtain the root directory of the build artifact cache, if configured."""
+    if "PYBUILD_ARTIFACT_CACHE" in os.environ:
+        return pathlib.Path(os.environ["PYBUILD_ARTIFACT_CACHE"])
+
+    return None
+
+
+def artifact_cache_key(inputs) -> str:
+    """Derive a build artifact cache key from a JSON serializable value."""
+    data = json.dumps(inputs, sort_keys=True).encode("utf-8")
+
+    return hashlib.sha256(data).hexdigest()
+
+
+def artifact_cache_get(key: str, dest: pathlib.Path) -> bool:
+    """Materialize a cached build artifact at a path.
+
+    Returns whether the artifact was found in the cache. Artifacts not
+    matching the SHA-256 recorded when storing them (e.g. truncated copies on
+    a shared filesystem) are treated as missing.
+    """
+    root = artifact_cache_root()
+    if not root:
+        return False
+
+    p = root / key[0:2] / ("%s.tar" % key)
+    sha256_path = p.with_name("%s.sha256" % p.name)
+    if not p.exists() or not sha256_path.exists():
+        return False
+
+    expected = sha256_path.read_text("ascii").strip()
+
+    # Artifacts are copied rather than hardlinked because build outputs are
+    # written in place and would otherwise modify the cache.
+    log("restoring %s from artifact cache %s" % (dest, p))
+    tmp = dest.with_name("%s.tmp%s" % (dest.name, random_suffix()))
+
+    try:
+        with p.open("rb") as ifh, tmp.open("wb") as ofh:
+            writer = HashingWriter(ofh)
+            shutil.copyfileobj(ifh, writer, COPY_BUFFER_SIZE)
+
+        if writer.hexdigest() != expected:
+            log(
+                "ignoring %s in artifact cache: SHA-256 %s does not match %s"
+                % (p, writer.hexdigest(), expected)
+            )
+            return False
+
+        os.replace(tmp, dest)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+    return True
+
+
+def artifact_cache_put(key: str, source: pathlib.Path):
+    """Store a build artifact in the artifact cache.
+
+    Its SHA-256 is recorded next to it to be verified when restoring it.
+    """
+    root = artifact_cache_root()
+    if not root:
+        return
+
+    p = root / key[0:2] / ("%s.tar" % key)
+    p.parent.mkdir(parents=True, exist_ok=True)
+
+    log("storing %s in artifact cache %s" % (source, p))
+    tmp = p.with_name("%s.tmp%s" % (p.name, random_suffix()))
+
+    with source.open("rb") as ifh, tmp.open("wb") as ofh:
+        writer = HashingWriter(ofh)
+        shutil.copyfileobj(ifh, writer, COPY_BUFFER_SIZE)
+
+    os.replace(tmp, p)
+
+    # Written after the artifact, so a concurrent reader at worst sees a
+    # mismatch and rebuilds.
+    sha256_path = p.with_name("%s.sha256" % p.name)
+    tmp = sha256_path.with_name("%s.tmp%s" % (sha256_path.name, random_suffix()))
+    tmp.write_text("%s\n" % writer.hexdigest(), "ascii")
+    os.replace(tmp, sha256_path)
+
+
+@contextlib.contextmanager
+def exclusive_lock(path: pathlib.Path):
+    """Hold an exclusive lock on a lock file, blocking until it is available.
+
+    Nothing is locked if locking isn't supported on this platform.
+    """
+    try:
+        import fcntl
+    except ImportError:
+        yield
+        return
+
+    with path.open("ab") as fh:
+        fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+        yield
+
+
+def fetch_url_to_path(url: str, path: pathlib.Path, size: int, sha256: str, attempts=5):
+    """Download a URL to a filesystem path with verification and retries."""
 
     # We download to a temporary file and rename at the end so there's
     # no chance of the final file being partially written or containing
     # bad data.
+    #
+    # The temporary file has a stable name so a download interrupted by a
+    # network error or a killed process can be resumed. If another process
+    # holds the lock on it, we download to a random path to avoid a race.
+    # Worst case we'll download the same file N>1 times. Meh.
+    tmp = path.with_name("%s.part" % path.name)
+    lock_fh: typing.Optional[typing.BinaryIO] = None
+    part_fh = tmp.open("ab")
+
+    if lock_file(part_fh):
+        lock_fh = part_fh
+    else:
+        part_fh.close()
+        tmp = path.with_name("%s.tmp%s" % (path.name, random_suffix()))
+
+    try:
+        for attempt in range(attempts):
+            resume = tmp.exists() and tmp.stat().st_size > 0
+
+            if resume:
+                print("resuming download of %s at %d bytes" % (url, tmp.stat().st_size))
+
+            try:
+                try:
+                    with tmp.open("ab") as fh:
+                        for chunk in secure_download_stream(
+                            url, size, sha256, resume_from=tmp if resume else None
+                        ):
+                            fh.write(chunk)
+
+                    break
+                except IntegrityError:
+                    if resume:
+                        print("resumed download of %s is corrupt; restarting" % url)
+                        tmp.open("wb").close()
+                        continue
+
+                    tmp.unlink()
+                    raise
+            except http.client.HTTPException as e:
+                print(f"HTTP exception on {url}; retrying: {e}")
+                time.sleep(2**attempt)
+            except urllib.error.URLError as e:
+                print(f"urllib error on {url}; retrying: {e}")
+                time.sleep(2**attempt)
+            except ConnectionError as e:
+                print(f"connection error on {url}; retrying: {e}")
+                time.sleep(2**attempt)
+        else:
+            raise Exception("download failed after multiple retries: %s" % url)
+
+        tmp.rename(path)
+    finally:
+        # Don't leave behind empty partial downloads.
+        if tmp.exists() and not tmp.stat().st_size:
+            tmp.unlink()
+
+        if lock_fh:
+            lock_fh.close()
+
+    print("successfully downloaded %s" % url)
+
+
+def download_mirrors():
+    """Obtain the configured download mirrors.
+
+    ``PYBUILD_DOWNLOAD_MIRRORS`` is a whitespace delimited list of base URLs
+    or local directories, consulted in order. Mirrors are expected to contain
+    files named after the final path component of the upstream URL.
+    """
+    return os.environ.get("PYBUILD_DOWNLOAD_MIRRORS", "").split()
+
+
+def is_offline() -> bool:
+    return bool(os.environ.get("PYBUILD_OFFLINE"))
+
+
+def fetch_to_path(
+    url: str, path: pathlib.Path, size: int, sha256: str, index: IntegrityIndex
+):
+    """Obtain a URL's content from a mirror, falling back to the URL itself.
+
+    Content from mirrors is verified against the same size and SHA-256 as
+    the upstream URL.
+    """
+    filename = url[url.rindex("/") + 1 :]
+
+    for mirror in download_mirrors():
+        if "://" in mirror:
+            if is_offline():
+                continue
+
+            mirror_url = "%s/%s" % (mirror.rstrip("/"), filename)
+            try:
+                fetch_url_to_path(mirror_url, path, size, sha256, attempts=1)
+                return
+            except Exception as e:
+                print("unable to download %s: %s" % (mirror_url, e))
+        else:
+            mirror_path = pathlib.Path(mirror) / filename
+            if mirror_path.exists() and verify_path(mirror_path, size, sha256, index):
+                print("copying %s from mirror" % mirror_path)
+                link_or_copy(mirror_path, path)
+                return
+
+    if is_offline():
+        raise Exception("%s is not available locally in offline mode" % url)
+
+    fetch_url_to_path(url, path, size, sha256)
+
+
+def download_to_path(url: str, path: pathlib.Path, size: int, sha256: str):
+    """Download a URL to a filesystem path, possibly with verification.
+
+    If ``PYBUILD_DOWNLOAD_CACHE`` is set, downloads are stored in a
+    content-addressed cache under that directory keyed by SHA-256 and
+    materialized at ``path`` via hardlink (or copy). The cache is safe to
+    share between checkouts and concurrent downloads.
+    """
     print("downloading %s to %s" % (url, path))
 
-    if path.exists():
-        good = True
+    cache_root = download_cache_root()
 
-        if path.stat().st_size != size:
-            print("existing file size is wrong; removing")
-            good = False
+    if cache_root:
+        index = IntegrityIndex(cache_root / "index.json")
+    else:
+        index = IntegrityIndex(path.parent / ".integrity-index.json")
 
-        if good:
-            if hash_path(path) != sha256:
-                print("existing file hash is wrong; removing")
-                good = False
+    if cache_root:
+        cache_path = cache_root / "sha256" / sha256[0:2] / sha256
 
-        if good:
+    if path.exists():
+        if verify_path(path, size, sha256, index):
             print("%s exists and passes integrity checks" % path)
+
+            # Count this as a use of the cache entry, if any.
+            if cache_root:
+                with download_cache_lock(cache_root):
+                    if (
+                        cache_path.exists()
+                        and index.verified_sha256(cache_path) == sha256
+                    ):
+                        index.record(cache_path, sha256)
+
             return
 
+        print("existing file fails integrity checks; removing")
         path.unlink()
 
-    # Need to write to random path to avoid race conditions. If there is a
-    # race, worst case we'll download the same file N>1 times. Meh.
-    tmp = path.with_name(
-        "%s.tmp%s"
-        % (
-            path.name,
-            "".join(random.choices(string.ascii_uppercase + string.digits, k=8)),
-        )
-    )
+    if not cache_root:
+        fetch_to_path(url, path, size, sha256, index)
+        index.record(path, sha256)
+        return
 
-    for attempt in range(5):
-        try:
-            try:
-                with tmp.open("wb") as fh:
-                    for chunk in secure_download_stream(url, size, sha256):
-                        fh.write(chunk)
+    with download_cache_lock(cache_root):
+        found = cache_path.exists() and verify_path(cache_path, size, sha256, index)
+        if found:
+            print("found %s in download cache" % url)
+            link_or_copy(cache_path, path)
+            # Also refreshes when the entry was last used.
+            index.record(cache_path, sha256)
 
-                break
-            except IntegrityError:
-                tmp.unlink()
-                raise
-        except http.client.HTTPException as e:
-            print(f"HTTP exception on {url}; retrying: {e}")
-            time.sleep(2**attempt)
-        except urllib.error.URLError as e:
-            print(f"urllib error on {url}; retrying: {e}")
-            time.sleep(2**attempt)
-    else:
-        raise Exception("download failed after multiple retries: %s" % url)
+    if not found:
+        # The download happens without holding the lock. It's only added to
+        # the cache once complete.
+        fetch_to_path(url, path, size, sha256, index)
 
-    tmp.rename(path)
-    print("successfully downloaded %s" % url)
+        with download_cache_lock(cache_root):
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            link_or_copy(path, cache_path)
+            index.record(cache_path, sha256)
+            evict_download_cache(cache_root, index, keep=cache_path)
+
+    index.record(path, sha256)
 
 
 def download_entry(key: str, dest_path: pathlib.Path, local_name=None) -> pathlib.Path:
@@ -323,6 +914,66 @@ def download_entry(key: str, dest_path: pathlib.Path, local_name=None) -> pathli
     return local_path
 
 
+def prefetch_downloads(keys, dest_path: pathlib.Path, jobs=8):
+    """Download multiple DOWNLOADS entries concurrently.
+
+    Each download is verified against the size and SHA-256 recorded in
+    DOWNLOADS. An exception is raised after all downloads have finished if
+    any of them failed.
+    """
+    dest_path.mkdir(parents=True, exist_ok=True)
+
+    keys = sorted(keys)
+    print("prefetching %d downloads with %d jobs" % (len(keys), jobs))
+
+    failures = []
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(download_entry, key, dest_path): key for key in keys}
+
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                print("error downloading %s: %s" % (futures[future], e))
+                failures.append(futures[future])
+
+    if failures:
+        raise Exception("failed to download: %s" % ", ".join(sorted(failures)))
+
+
+def populate_download_mirror(
+    dest_path: pathlib.Path, yaml_path: pathlib.Path, targets=None, jobs=8
+):
+    """Download everything needed to build targets into a mirror directory.
+
+    If ``targets`` isn't defined, all targets in the YAML file are mirrored.
+    """
+    all_targets = get_targets(yaml_path)
+
+    keys = set()
+
+    for target in targets or sorted(all_targets):
+        settings = all_targets[target]
+
+        for host_platform in settings["host_platforms"]:
+            for python in settings["pythons_supported"]:
+                keys |= target_downloads(
+                    yaml_path,
+                    target,
+                    host_platform,
+                    python,
+                    python_entry="cpython-%s" % python,
+                )
+
+            # The macOS toolchain depends on the architecture of the machine
+            # building.
+            if host_platform == "macos":
+                keys |= {"llvm-aarch64-macos", "llvm-x86_64-macos"}
+
+    prefetch_downloads(keys, dest_path, jobs=jobs)
+
+
 def create_tar_from_directory(fh, base_path: pathlib.Path, path_prefix=None):
     with tarfile.open(name="", mode="w", fileobj=fh) as tf:
         for root, dirs, files in os.walk(base_path):
@@ -341,6 +992,142 @@ def extract_tar_to_directory(source: pathlib.Path, dest: pathlib.Path):
         tf.extractall(dest)
 
 
+# ioctl() request cloning the extents of a file on Linux (a reflink).
+FICLONE = 0x40049409
+
+
+def reflink_file(source: pathlib.Path, dest: pathlib.Path) -> bool:
+    """Attempt to create a file as a copy-on-write clone of another file.
+
+    Returns False if the filesystem (or platform) doesn't support it.
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+
+    import fcntl
+
+    with source.open("rb") as sfh:
+        with dest.open("wb") as dfh:
+            try:
+                fcntl.ioctl(dfh.fileno(), FICLONE, sfh.fileno())
+                cloned = True
+            except OSError:
+                cloned = False
+
+    if cloned:
+        shutil.copystat(source, dest)
+    else:
+        dest.unlink()
+
+    return cloned
+
+
+def populate_directory(
+    source: pathlib.Path, dest: pathlib.Path, hardlink=True, exclude=()
+):
+    """Materialize the content of a directory tree in another directory.
+
+    Files are reflinked if the filesystem supports it, else hardlinked (if
+    ``hardlink`` is true), else copied. Existing files in ``dest`` are
+    replaced rather than written to. Hardlinked files share their data with
+    ``source``, so they must not be modified in place either. Entries
+    matching ``exclude`` (see ``path_excluded()``) are skipped.
+
+    Returns a dict of the number of files materialized by each method.
+    """
+    counts: collections.Counter[str] = collections.Counter()
+    method = "reflink"
+
+    for root, dirs, files in os.walk(source):
+        rel = pathlib.Path(root).relative_to(source)
+        dest_root = dest / rel
+
+        if exclude:
+            prefix = "" if rel == pathlib.Path(".") else "%s/" % rel.as_posix()
+            dirs[:] = [d for d in dirs if not path_excluded(prefix + d, exclude)]
+            files = [f for f in files if not path_excluded(prefix + f, exclude)]
+
+        # Other archives may be materialized in the same directory concurrently.
+        try:
+            dest_root.mkdir(parents=True)
+            shutil.copymode(root, dest_root)
+        except FileExistsError:
+            pass
+
+        # os.walk() reports symlinks to directories as directories.
+        for name in dirs + files:
+            source_path = pathlib.Path(root) / name
+            dest_path = dest_root / name
+
+            if not source_path.is_symlink() and source_path.is_dir():
+                continue
+
+            tmp = dest_path.with_name("%s.tmp%s" % (name, random_suffix()))
+
+            if source_path.is_symlink():
+                os.symlink(os.readlink(source_path), tmp)
+                counts["symlink"] += 1
+            elif dest_path.exists() and os.path.samestat(
+                os.lstat(source_path), os.lstat(dest_path)
+            ):
+                # Already linked. (Renaming over it would be a no-op.)
+                counts["hardlink"] += 1
+                continue
+            else:
+                if method == "reflink" and not reflink_file(source_path, tmp):
+                    method = "hardlink" if hardlink else "copy"
+
+                if method == "hardlink":
+                    try:
+                        os.link(source_path, tmp)
+                    except OSError:
+                        method = "copy"
+
+                if method == "copy":
+                    shutil.copy2(source_path, tmp)
+
+                counts[method] += 1
+
+            os.replace(tmp, dest_path)
+
+    return dict(counts)
+
+
+def extract_tar_to_directory_cached(
+    source: pathlib.Path, dest: pathlib.Path, cache_dir: pathlib.Path, sha256: str
+):
+    """Extract a tar archive to a directory through a cache of extracted archives.
+
+    The archive is extracted into ``cache_dir`` once per SHA-256 and its
+    content is materialized in ``dest`` with ``populate_directory()``.
+    Extractions of previous versions of an archive with the same name are
+    evicted from the cache.
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    entry = cache_dir / ("%s-%s" % (source.name, sha256))
+
+    with exclusive_lock(cache_dir / ("%s.lock" % source.name)):
+        if not entry.is_dir():
+            for p in cache_dir.glob("%s-*" % glob.escape(source.name)):
+                log("evicting %s from extracted archive cache" % p.name)
+                shutil.rmtree(p)
+
+            tmp = entry.with_name("%s.tmp%s" % (entry.name, random_suffix()))
+            extract_tar_to_directory(source, tmp)
+            os.rename(tmp, entry)
+
+        counts = populate_directory(entry, dest)
+
+    log(
+        "materialized %s in %s: %s"
+        % (
+            source.name,
+            dest,
+            ", ".join("%d %s" % (v, k) for k, v in sorted(counts.items())),
+        )
+    )
+
+
 def extract_zip_to_directory(source: pathlib.Path, dest: pathlib.Path):
     with zipfile.ZipFile(source, "r") as zf:
         zf.extractall(dest)
@@ -350,74 +1137,251 @@ def extract_zip_to_directory(source: pathlib.Path, dest: pathlib.Path):
 DEFAULT_MTIME = 1704067200
 
 
-def normalize_tar_archive(data: io.BytesIO) -> io.BytesIO:
-    """Normalize the contents of a tar archive.
+def normalize_tar_member(ti: tarfile.TarInfo):
+    """Normalize the attributes of a tar archive member."""
+    # The pax headers attribute takes priority over the other named
+    # attributes. To minimize potential for our assigns to no-op, we
+    # clear out the pax headers. We can't reset all the pax headers,
+    # as this would nullify symlinks.
+    for a in ("mtime", "uid", "uname", "gid", "gname"):
+        try:
+            ti.pax_headers.__delattr__(a)
+        except AttributeError:
+            pass
+
+    ti.pax_headers = {}
+
+    ti.mtime = DEFAULT_MTIME
+    ti.uid = 0
+    ti.uname = "root"
+    ti.gid = 0
+    ti.gname = "root"
+
+    # Give user/group read/write on all entries.
+    ti.mode |= stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP | stat.S_IWGRP
+
+    # If user executable, give to group as well.
+    if ti.mode & stat.S_IXUSR:
+        ti.mode |= stat.S_IXGRP
+
 
-    We want tar archives to be as deterministic as possible. This function will
-    take tar archive data in a buffer and return a new buffer containing a more
-    deterministic tar archive.
+def normalize_tar_archive_to_file(source, dest):
+    """Write a normalized copy of a tar archive to a file object.
+
+    We want tar archives to be as deterministic as possible. ``source`` must
+    be seekable: only the index of archive members is held in memory and the
+    content of each member is streamed from its offset in the source archive.
+    """
+    with tarfile.open(fileobj=source) as itf:
+        # We don't care about directory entries. Tools can handle this fine.
+        members = [ti for ti in itf if not ti.isdir()]
+
+        # Sort the archive members. We put PYTHON.json first so metadata can
+        # be read without reading the entire archive.
+        def sort_key(ti):
+            if ti.name == "python/PYTHON.json":
+                return 0, ti.name
+            else:
+                return 1, ti.name
+
+        members.sort(key=sort_key)
+
+        with tarfile.open(fileobj=dest, mode="w") as otf:
+            for ti in members:
+                filedata = itf.extractfile(ti)
+                normalize_tar_member(ti)
+                otf.addfile(ti, filedata)
+
+
+def path_excluded(rel: str, exclude) -> bool:
+    """Whether a relative path matches any of a set of exclusion patterns.
+
+    Patterns containing a ``/`` are matched against the path from the root of
+    the tree. Other patterns are matched against the name of every entry.
+    """
+    name = rel.rsplit("/", 1)[-1]
+
+    for pattern in exclude:
+        if fnmatch.fnmatch(rel if "/" in pattern else name, pattern):
+            return True
+
+    return False
+
+
+def tar_members_from_directory(
+    base_path: pathlib.Path, path_prefix=None, normalize=True, exclude=()
+):
+    """Obtain tar archive members for the content of a directory.
+
+    Returns a list of ``(TarInfo, path)`` in archive order. Normalized members
+    are the same as those of ``create_tar_from_directory()`` after
+    normalization with ``normalize_tar_archive_to_file()``, without writing an
+    intermediate archive. Otherwise, modification times are preserved.
+    Entries matching ``exclude`` (see ``path_excluded()``) are skipped.
     """
     members = []
+    inodes: dict[tuple[int, int], str] = {}
+
+    def walk(path, rel):
+        with os.scandir(path) as it:
+            entries = sorted(it, key=lambda e: e.name)
 
-    with tarfile.open(fileobj=data) as tf:
-        for ti in tf:
-            # We don't care about directory entries. Tools can handle this fine.
-            if ti.isdir():
+        subdirs = []
+
+        for entry in entries:
+            if exclude and path_excluded(rel + entry.name, exclude):
+                continue
+
+            # Like os.walk(), don't descend into symlinks to directories.
+            # create_tar_from_directory() doesn't archive them either.
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    subdirs.append(entry)
+                continue
+
+            st = entry.stat(follow_symlinks=False)
+
+            ti = tarfile.TarInfo(prefix + rel + entry.name)
+            ti.mode = stat.S_IMODE(st.st_mode)
+            ti.mtime = int(st.st_mtime)
+
+            # Hardlinks are detected like tarfile.TarFile.gettarinfo() does.
+            if stat.S_ISREG(st.st_mode):
+                inode = (st.st_ino, st.st_dev)
+                if st.st_nlink > 1 and inode in inodes:
+                    ti.type = tarfile.LNKTYPE
+                    ti.linkname = inodes[inode]
+                else:
+                    ti.type = tarfile.REGTYPE
+                    ti.size = st.st_size
+                    if st.st_ino:
+                        inodes[inode] = ti.name
+            elif stat.S_ISLNK(st.st_mode):
+                ti.type = tarfile.SYMTYPE
+                ti.linkname = os.readlink(entry.path)
+            elif stat.S_ISFIFO(st.st_mode):
+                ti.type = tarfile.FIFOTYPE
+            else:
                 continue
 
-            filedata = tf.extractfile(ti)
-            if filedata is not None:
-                filedata = io.BytesIO(filedata.read())
+            if normalize:
+                normalize_tar_member(ti)
+            members.append((ti, entry.path))
+
+        for entry in subdirs:
+            walk(entry.path, rel + entry.name + "/")
+
+    prefix = "%s/" % path_prefix if path_prefix else ""
+    walk(str(base_path), "")
+
+    # Sort like normalize_tar_archive_to_file(), which puts PYTHON.json first.
+    members.sort(key=lambda m: (m[0].name != "python/PYTHON.json", m[0].name))
 
-            members.append((ti, filedata))
+    return members
 
-    # Sort the archive members. We put PYTHON.json first so metadata can
-    # be read without reading the entire archive.
-    def sort_key(v):
-        if v[0].name == "python/PYTHON.json":
-            return 0, v[0].name
+
+# Buffer size for copying file content when sendfile() isn't available.
+COPY_BUFFER_SIZE = 1048576
+
+
+def copy_file_content(source: str, fh, size: int):
+    """Copy ``size`` bytes of a file to a file object.
+
+    The kernel copies the data with sendfile() if ``fh`` is an unbuffered
+    file on Linux.
+    """
+    with open(source, "rb") as sfh:
+        if isinstance(fh, io.FileIO) and sys.platform.startswith("linux"):
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(fh.fileno(), sfh.fileno(), offset, size - offset)
+                if not sent:
+                    break
+                offset += sent
         else:
-            return 1, v[0].name
+            offset = 0
+            while offset < size:
+                chunk = sfh.read(min(COPY_BUFFER_SIZE, size - offset))
+                if not chunk:
+                    break
+                fh.write(chunk)
+                offset += len(chunk)
 
-    members.sort(key=sort_key)
+    if offset != size:
+        raise OSError("%s changed size while being archived" % source)
 
-    # Normalize attributes on archive members.
-    for entry in members:
-        ti = entry[0]
 
-        # The pax headers attribute takes priority over the other named
-        # attributes. To minimize potential for our assigns to no-op, we
-        # clear out the pax headers. We can't reset all the pax headers,
-        # as this would nullify symlinks.
-        for a in ("mtime", "uid", "uname", "gid", "gname"):
-            try:
-                ti.pax_headers.__delattr__(a)
-            except AttributeError:
-                pass
+def write_normalized_tar_from_directory(fh, base_path: pathlib.Path, path_prefix=None):
+    """Write a normalized tar archive of a directory to a file object.
+
+    The output is identical to normalizing the output of
+    ``create_tar_from_directory()``, but the tree is archived in a single
+    pass. Pass an unbuffered file to have file content copied by the kernel.
+    """
+    write_tar_members(fh, tar_members_from_directory(base_path, path_prefix))
 
-        ti.pax_headers = {}
 
-        ti.mtime = DEFAULT_MTIME
-        ti.uid = 0
-        ti.uname = "root"
-        ti.gid = 0
-        ti.gname = "root"
+def write_tar_members(fh, members):
+    """Write a tar archive of ``tar_members_from_directory()`` to a file object."""
+    offset = 0
 
-        # Give user/group read/write on all entries.
-        ti.mode |= stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP | stat.S_IWGRP
+    for ti, path in members:
+        header = ti.tobuf(tarfile.DEFAULT_FORMAT, tarfile.ENCODING, "surrogateescape")
+        fh.write(header)
+        offset += len(header)
 
-        # If user executable, give to group as well.
-        if ti.mode & stat.S_IXUSR:
-            ti.mode |= stat.S_IXGRP
+        if ti.isreg():
+            copy_file_content(path, fh, ti.size)
 
-    dest = io.BytesIO()
-    with tarfile.open(fileobj=dest, mode="w") as tf:
-        for ti, filedata in members:
-            tf.addfile(ti, filedata)
+            remainder = ti.size % tarfile.BLOCKSIZE
+            if remainder:
+                fh.write(tarfile.NUL * (tarfile.BLOCKSIZE - remainder))
+            offset += ti.size + (tarfile.BLOCKSIZE - remainder if remainder else 0)
 
-    dest.seek(0)
+    # End of archive marker and padding, as written by tarfile.TarFile.close().
+    fh.write(tarfile.NUL * (tarfile.BLOCKSIZE * 2))
+    offset += tarfile.BLOCKSIZE * 2
 
-    return dest
+    remainder = offset % tarfile.RECORDSIZE
+    if remainder:
+        fh.write(tarfile.NUL * (tarfile.RECORDSIZE - remainder))
+
+
+def write_normalized_tar_from_directory_to_path(
+    base_path: pathlib.Path, dest_path: pathlib.Path, path_prefix=None
+):
+    """Write a normalized tar archive of a directory to a path.
+
+    The destination is replaced atomically.
+    """
+    tmp = dest_path.with_name("%s.tmp%s" % (dest_path.name, random_suffix()))
+
+    try:
+        with open(tmp, "wb", buffering=0) as fh:
+            write_normalized_tar_from_directory(fh, base_path, path_prefix)
+
+        os.replace(tmp, dest_path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def write_normalized_tar_archive(source, dest_path: pathlib.Path):
+    """Write a normalized copy of a seekable tar archive to a path.
+
+    The destination is replaced atomically so make never sees a partially
+    written archive.
+    """
+    tmp = dest_path.with_name("%s.tmp%s" % (dest_path.name, random_suffix()))
+
+    try:
+        with tmp.open("wb") as fh:
+            normalize_tar_archive_to_file(source, fh)
+
+        os.replace(tmp, dest_path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
 
 
 def clang_toolchain(host_platform: str, target_triple: str) -> str:
@@ -436,31 +1400,527 @@ def clang_toolchain(host_platform: str, target_triple: str) -> str:
         raise Exception("unhandled host platform")
 
 
+# zstd compression profiles for distribution archives.
+COMPRESSION_PROFILES: dict[str, dict[str, typing.Any]] = {
+    # Maximum compression for published archives.
+    "release": {
+        "level": 22,
+        "strategy": zstandard.STRATEGY_BTULTRA2,
+        "long_distance_matching": False,
+        # The default job size is 4x the window (512 MiB at level 22), which
+        # leaves most archives as a single serial job. Smaller jobs spread
+        # the work across threads and reusing the whole preceding window
+        # keeps the ratio of single-job compression. These are fixed so the
+        # output stays independent of the number of threads.
+        "job_size": 32 * 1024**2,
+        "overlap_log": 9,
+    },
+    # Quick compression for local and CI builds that aren't published.
+    "fast": {
+        "level": 9,
+        "strategy": None,
+        "long_distance_matching": True,
+    },
+}
+
+# Decoders refuse windows larger than 128 MiB unless explicitly allowed (e.g.
+# ``zstd --long=31``). So archives must not need a larger one.
+MAX_COMPRESSION_WINDOW_LOG = 27
+
+
+def compression_threads() -> int:
+    """Number of zstd worker threads to compress with.
+
+    zstd's multi-threaded output doesn't depend on the number of workers (as
+    long as there is at least 1), so this doesn't impact reproducibility.
+    """
+    if "PYBUILD_COMPRESSION_THREADS" in os.environ:
+        threads = int(os.environ["PYBUILD_COMPRESSION_THREADS"])
+
+        # 0 would select zstd's single-threaded mode, whose output differs.
+        if threads < 1:
+            raise Exception("PYBUILD_COMPRESSION_THREADS must be at least 1")
+
+        return threads
+
+    return max(available_cpu_count(), 1)
+
+
+def zstd_compression_parameters(
+    level: int,
+    source_size: int,
+    strategy=None,
+    long_distance_matching=False,
+    threads=None,
+    job_size=None,
+    overlap_log=None,
+) -> zstandard.ZstdCompressionParameters:
+    """Resolve zstd compression parameters.
+
+    With long distance matching, the window is sized to cover the whole
+    source, up to ``MAX_COMPRESSION_WINDOW_LOG``.
+
+    ``job_size`` is the amount of input each worker thread compresses at a
+    time and ``overlap_log`` how much of the window preceding a job it
+    reuses (9 being the whole window). Both affect the output, unlike the
+    number of threads.
+    """
+    kwargs = {
+        "threads": compression_threads() if threads is None else threads,
+    }
+
+    if strategy is not None:
+        kwargs["strategy"] = strategy
+
+    if job_size is not None:
+        kwargs["job_size"] = job_size
+
+    if overlap_log is not None:
+        kwargs["overlap_log"] = overlap_log
+
+    if long_distance_matching:
+        kwargs["enable_ldm"] = True
+        kwargs["window_log"] = max(
+            zstandard.WINDOWLOG_MIN,
+            min(MAX_COMPRESSION_WINDOW_LOG, (max(source_size, 1) - 1).bit_length()),
+        )
+
+    return zstandard.ZstdCompressionParameters.from_level(level, **kwargs)
+
+
 def compress_python_archive(
-    source_path: pathlib.Path, dist_path: pathlib.Path, basename: str
+    source_path: pathlib.Path,
+    dist_path: pathlib.Path,
+    basename: str,
+    profile=None,
+    install_only=False,
+    llvm_strip=None,
 ):
+    """Compress a Python archive with zstd.
+
+    ``profile`` is a key of ``COMPRESSION_PROFILES`` and defaults to the
+    ``PYBUILD_COMPRESSION_PROFILE`` environment variable or ``release``.
+
+    If ``install_only`` is true, the ``install_only`` ``.tar.gz`` archive is
+    produced in the same pass over the source archive. If ``llvm_strip`` is
+    also given, the ``install_only_stripped`` archive is produced as well,
+    with binaries stripped by that ``llvm-strip`` executable.
+    """
+    profile = profile or os.environ.get("PYBUILD_COMPRESSION_PROFILE", "release")
+
     dest_path = dist_path / ("%s.tar.zst" % basename)
-    temp_path = dist_path / ("%s.tar.zst.tmp" % basename)
 
-    print("compressing Python archive to %s" % dest_path)
+    outputs = [dest_path]
+    if install_only:
+        outputs.append(dist_path / ("%s.tar.gz" % install_only_basename(basename)))
+        if llvm_strip:
+            outputs.append(
+                dist_path
+                / (
+                    "%s.tar.gz"
+                    % install_only_basename(basename, "install_only_stripped")
+                )
+            )
+
+    temp_paths = [p.with_name("%s.tmp%s" % (p.name, random_suffix())) for p in outputs]
+
+    print("compressing Python archive to %s (%s profile)" % (dest_path, profile))
+
+    source_size = source_path.stat().st_size
 
     try:
-        with source_path.open("rb") as ifh, temp_path.open("wb") as ofh:
-            params = zstandard.ZstdCompressionParameters.from_level(
-                22, strategy=zstandard.STRATEGY_BTULTRA2
+        with contextlib.ExitStack() as stack:
+            ifh = stack.enter_context(source_path.open("rb"))
+
+            # Every output is hashed as it streams by so artifacts never need
+            # to be read again to be checksummed.
+            writers = [
+                HashingWriter(stack.enter_context(p.open("wb"))) for p in temp_paths
+            ]
+            reader = HashingReader(ifh)
+
+            params = zstd_compression_parameters(
+                source_size=source_size, **COMPRESSION_PROFILES[profile]
             )
             cctx = zstandard.ZstdCompressor(compression_params=params)
-            cctx.copy_stream(ifh, ofh, source_path.stat().st_size)
 
-        temp_path.rename(dest_path)
+            if not install_only:
+                cctx.copy_stream(
+                    typing.cast(typing.BinaryIO, reader),
+                    typing.cast(typing.BinaryIO, writers[0]),
+                    source_size,
+                )
+            else:
+                with cctx.stream_writer(
+                    typing.cast(typing.BinaryIO, writers[0]),
+                    size=source_size,
+                    closefd=False,
+                ) as compressor:
+                    tee = io.BufferedReader(TeeReader(reader, compressor))
+
+                    with tarfile.open(fileobj=tee, mode="r|") as tf:
+                        write_install_only_archives(
+                            tf,
+                            writers[1],
+                            writers[2] if llvm_strip else None,
+                            llvm_strip=llvm_strip,
+                        )
+
+                    # Pass along anything after the end of the archive to the
+                    # full archive.
+                    while tee.read(COPY_BUFFER_SIZE):
+                        pass
+
+        for i, path in enumerate(outputs):
+            temp_paths[i].rename(path)
     finally:
-        temp_path.unlink(missing_ok=True)
+        for temp_path in temp_paths:
+            temp_path.unlink(missing_ok=True)
+
+    write_artifact_manifest(
+        dest_path,
+        {
+            "sha256": writers[0].hexdigest(),
+            "size": writers[0].size,
+            "uncompressed_sha256": reader.hexdigest(),
+            "uncompressed_size": reader.size,
+            "compression_profile": profile,
+        },
+    )
 
-    print("%s has SHA256 %s" % (dest_path, hash_path(dest_path)))
+    for i, path in enumerate(outputs):
+        if i:
+            write_artifact_manifest(
+                path, {"sha256": writers[i].hexdigest(), "size": writers[i].size}
+            )
+
+        print("%s has SHA256 %s" % (path, writers[i].hexdigest()))
 
     return dest_path
 
 
+def install_only_basename(basename: str, flavor="install_only") -> str:
+    """Derive the name of an install_only archive from a full archive's.
+
+    e.g. ``cpython-3.12.4-x86_64-unknown-linux-gnu-pgo+lto-20240722T0909``
+    becomes ``cpython-3.12.4-x86_64-unknown-linux-gnu-install_only-20240722T0909``.
+    """
+    parts = basename.split("-")
+    parts[-2] = flavor
+
+    return "-".join(parts)
+
+
+# The magic prefix of PDB files.
+PDB_MAGIC = b"Microsoft C/C++ MSF 7.00\r\n\x1aDS\x00\x00\x00"
+
+
+def is_strippable_binary(data: bytes) -> bool:
+    """Whether data is an ELF, Mach-O, or PE binary."""
+    if data[0:4] == b"\x7fELF":
+        return True
+
+    if data[0:4] in (
+        b"\xfe\xed\xfa\xce",
+        b"\xce\xfa\xed\xfe",
+        b"\xfe\xed\xfa\xcf",
+        b"\xcf\xfa\xed\xfe",
+    ):
+        return True
+
+    # Universal Mach-O binaries share their magic with Java class files. The
+    # latter have a version number where the former have a small number of
+    # architectures.
+    if data[0:4] == b"\xca\xfe\xba\xbe" and 0 < int.from_bytes(data[4:8], "big") < 45:
+        return True
+
+    if data[0:2] == b"MZ" and len(data) >= 0x40:
+        offset = int.from_bytes(data[0x3C:0x40], "little")
+        return data[offset : offset + 4] == b"PE\x00\x00"
+
+    return False
+
+
+def run_llvm_strip(llvm_strip, data: bytes) -> bytes:
+    """Strip debug info from a binary with ``llvm-strip``."""
+    res = subprocess.run(
+        [str(llvm_strip), "--strip-debug", "-"],
+        input=data,
+        stdout=subprocess.PIPE,
+        check=True,
+    )
+
+    return res.stdout
+
+
+def host_llvm_strip(
+    host_platform: str, target_triple: str, build_dir: pathlib.Path
+) -> pathlib.Path:
+    """Obtain the ``llvm-strip`` of the LLVM toolchain running on the host.
+
+    The toolchain is downloaded and extracted into ``build_dir`` once. This
+    is safe to call from concurrent processes.
+    """
+    entry = clang_toolchain(host_platform, target_triple)
+    archive = download_entry(entry, build_dir / "downloads")
+    dest = build_dir / ("%s-%s" % (entry, DOWNLOADS[entry]["version"]))
+
+    if not dest.is_dir():
+        tmp = dest.with_name("%s.tmp%s" % (dest.name, random_suffix()))
+
+        with archive.open("rb") as fh:
+            with zstandard.ZstdDecompressor().stream_reader(fh) as reader:
+                with tarfile.open(fileobj=reader, mode="r|") as tf:
+                    tf.extractall(tmp)
+
+        try:
+            os.rename(tmp, dest)
+        except OSError:
+            # Another process extracted it first.
+            if not dest.is_dir():
+                raise
+            shutil.rmtree(tmp)
+
+    return dest / "llvm" / "bin" / "llvm-strip"
+
+
+@contextlib.contextmanager
+def gzip_tar_writer(fh):
+    """Write a deterministic gzip compressed tar archive to a file object."""
+    with gzip.GzipFile(filename="", mode="wb", fileobj=fh, mtime=0) as gz:
+        with tarfile.open(fileobj=gz, mode="w") as tf:
+            yield tf
+
+
+def write_install_only_archives(tf, install_only_fh, stripped_fh=None, llvm_strip=None):
+    """Write install_only archives from a full distribution archive.
+
+    ``tf`` is a ``tarfile`` of the full archive, which may be a stream. The
+    ``install_only`` archive holds the ``python/install/`` tree without the
+    static libpython and the standard library tests. The
+    ``install_only_stripped`` archive additionally has debug info stripped
+    from binaries and omits PDB files.
+    """
+    members = iter(tf)
+
+    # The first entry is PYTHON.json so we can filter the rest as they stream
+    # by.
+    ti = next(members, None)
+    if ti is None or ti.name != "python/PYTHON.json":
+        raise Exception("first archive entry not PYTHON.json")
+
+    fh = tf.extractfile(ti)
+    if fh is None:
+        raise Exception("PYTHON.json is not a regular file")
+
+    info = json.loads(fh.read())
+
+    test_prefixes = tuple(
+        "python/%s/%s/" % (info["python_paths"]["stdlib"], p.replace(".", "/"))
+        for p in info.get("python_stdlib_test_packages", [])
+    )
+
+    with contextlib.ExitStack() as stack:
+        install_only = stack.enter_context(gzip_tar_writer(install_only_fh))
+        if stripped_fh:
+            stripped = stack.enter_context(gzip_tar_writer(stripped_fh))
+        else:
+            stripped = None
+
+        for ti in members:
+            if not ti.name.startswith("python/install/"):
+                continue
+
+            # The static libpython significantly increases the size of the
+            # archive and isn't needed in most cases.
+            if "/libpython" in ti.name and ti.name.endswith(".a"):
+                continue
+
+            if ti.name.startswith(test_prefixes):
+                continue
+
+            ti.name = "python/%s" % ti.name[len("python/install/") :]
+            if ti.islnk() and ti.linkname.startswith("python/install/"):
+                ti.linkname = "python/%s" % ti.linkname[len("python/install/") :]
+
+            fh = tf.extractfile(ti) if ti.isreg() else None
+
+            if fh is None:
+                install_only.addfile(ti)
+                if stripped:
+                    stripped.addfile(ti)
+                continue
+
+            if not stripped:
+                install_only.addfile(ti, fh)
+                continue
+
+            data = fh.read()
+            install_only.addfile(ti, io.BytesIO(data))
+
+            if data.startswith(PDB_MAGIC):
+                continue
+
+            if is_strippable_binary(data):
+                try:
+                    data = run_llvm_strip(llvm_strip, data)
+                except subprocess.CalledProcessError as e:
+                    raise Exception("failed to strip %s" % ti.name) from e
+
+                ti.size = len(data)
+
+            stripped.addfile(ti, io.BytesIO(data))
+
+
+class TeeReader(io.RawIOBase):
+    """A raw stream copying the data read from another one to a writer.
+
+    Wrap it in ``io.BufferedReader`` to obtain an ``IO[bytes]``.
+    """
+
+    def __init__(self, fh, writer) -> None:
+        super().__init__()
+        self._fh = fh
+        self._writer = writer
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        data = self._fh.read(len(b))
+        self._writer.write(data)
+        b[: len(data)] = data
+        return len(data)
+
+
+class HashingReader(object):
+    """A file-like object hashing the data read from another one."""
+
+    def __init__(self, fh) -> None:
+        self._fh = fh
+        self._hasher: "hashlib._Hash" = hashlib.sha256()
+        self.size = 0
+
+    def read(self, size=-1):
+        data = self._fh.read(size)
+        self._hasher.update(data)
+        self.size += len(data)
+        return data
+
+    def hexdigest(self) -> str:
+        return self._hasher.hexdigest()
+
+
+class HashingWriter(object):
+    """A file-like object hashing the data written through it to another one."""
+
+    def __init__(self, fh) -> None:
+        self._fh = fh
+        self._hasher: "hashlib._Hash" = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data):
+        self._hasher.update(data)
+        self.size += len(data)
+        return self._fh.write(data)
+
+    def flush(self) -> None:
+        self._fh.flush()
+
+    def hexdigest(self) -> str:
+        return self._hasher.hexdigest()
+
+
+def write_artifact_manifest(path: pathlib.Path, info):
+    """Write checksum sidecar files next to a build artifact.
+
+    ``<artifact>.sha256`` holds the hex digest in the same format as the
+    release assets and ``<artifact>.json`` holds ``info``, which must contain
+    at least the ``sha256`` and ``size`` keys.
+    """
+    write_if_different(
+        path.with_name("%s.sha256" % path.name),
+        ("%s\n" % info["sha256"]).encode("ascii"),
+    )
+    write_if_different(
+        path.with_name("%s.json" % path.name),
+        json.dumps(info, sort_keys=True, indent=4).encode("utf-8"),
+    )
+
+
+def copy_artifact(source_path: pathlib.Path, dest_path: pathlib.Path):
+    """Copy a build artifact along with its checksum sidecar files."""
+    shutil.copy2(source_path, dest_path)
+
+    for suffix in ("sha256", "json"):
+        shutil.copy2(
+            source_path.with_name("%s.%s" % (source_path.name, suffix)),
+            dest_path.with_name("%s.%s" % (dest_path.name, suffix)),
+        )
+
+
+class CountingWriter(object):
+    """A file-like object counting the bytes written to it."""
+
+    def __init__(self):
+        self.size = 0
+
+    def write(self, data):
+        self.size += len(data)
+        return len(data)
+
+
+def benchmark_compression(source_path: pathlib.Path, levels=None, threads=None):
+    """Print compression ratio and wall time of zstd settings on an archive."""
+    source_size = source_path.stat().st_size
+
+    threads = compression_threads() if threads is None else threads
+
+    settings = []
+    for name, profile in COMPRESSION_PROFILES.items():
+        settings.append(("%s profile" % name, profile))
+        # Show what multi-threading gains over a single worker.
+        if threads > 1:
+            settings.append(("%s profile 1 thread" % name, dict(profile, threads=1)))
+    for level in levels or (3, 9, 15, 19, 22):
+        for ldm in (False, True):
+            settings.append(
+                (
+                    "level %d%s" % (level, " +ldm" if ldm else ""),
+                    {"level": level, "long_distance_matching": ldm},
+                )
+            )
+
+    print(
+        "%s: %.1f MiB, %d compression threads"
+        % (source_path, source_size / 1024**2, threads)
+    )
+    print("%-26s %10s %7s %9s %9s" % ("settings", "MiB", "ratio", "seconds", "MiB/s"))
+
+    for name, kwargs in settings:
+        params = zstd_compression_parameters(
+            source_size=source_size, **dict({"threads": threads}, **kwargs)
+        )
+        cctx = zstandard.ZstdCompressor(compression_params=params)
+
+        writer = CountingWriter()
+        start = time.monotonic()
+        with source_path.open("rb") as fh:
+            cctx.copy_stream(fh, typing.cast(typing.BinaryIO, writer), source_size)
+        duration = time.monotonic() - start
+
+        print(
+            "%-26s %10.1f %7.2f %9.1f %9.1f"
+            % (
+                name,
+                writer.size / 1024**2,
+                source_size / writer.size,
+                duration,
+                source_size / 1024**2 / duration,
+            )
+        )
+
+
 def add_licenses_to_extension_entry(entry):
     """Add licenses keys to a ``extensions`` entry for JSON distribution info."""
 
@@ -503,10 +1963,196 @@ def add_licenses_to_extension_entry(entry):
     entry["license_public_domain"] = license_public_domain
 
 
+# Rough peak memory usage of a single package build. Used to bound the
+# number of concurrent builds on machines with little memory.
+BUILD_MEMORY_ESTIMATE = 2 * 1024**3
+
+
+def available_cpu_count() -> int:
+    """Obtain the number of CPUs this process is allowed to run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+
+    return multiprocessing.cpu_count()
+
+
+def physical_memory():
+    """Obtain the amount of physical memory in bytes, if it can be determined."""
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def build_parallelism(variants=1, serial=False):
+    """Determine the parallelism to use for a build.
+
+    Returns a dict with keys ``outer`` (number of concurrent package builds),
+    ``inner`` (make jobs within each dependency build), and ``cpython`` (make
+    jobs within each CPython build), plus the inputs used to derive them.
+
+    Most dependency builds can't make use of many cores, so we run several
+    of them concurrently and give each a share of the machine. The CPython
+    build is the final node of the build graph and gets the whole machine
+    unless multiple variants are built concurrently.
+    """
+    cpu_count = available_cpu_count()
+    memory = physical_memory()
+
+    if memory:
+        memory_limit = max(1, memory // BUILD_MEMORY_ESTIMATE)
+    else:
+        memory_limit = cpu_count
+
+    if serial:
+        outer = 1
+    else:
+        outer = max(1, min(cpu_count, memory_limit, max(4, cpu_count // 4)))
+
+    inner = max(1, cpu_count // outer)
+
+    return {
+        "cpu_count": cpu_count,
+        "memory": memory,
+        "memory_limit": memory_limit,
+        "outer": outer,
+        "inner": inner,
+        "cpython": max(inner, cpu_count // variants),
+    }
+
+
+def print_parallelism_report(parallelism):
+    """Print a summary of scheduled parallelism."""
+    memory = parallelism["memory"]
+
+    print(
+        "parallelism: %d CPUs, %s memory"
+        % (
+            parallelism["cpu_count"],
+            "%.1f GiB" % (memory / 1024**3) if memory else "unknown",
+        )
+    )
+    print(
+        "  concurrent package builds: %d (memory allows %d)"
+        % (parallelism["outer"], parallelism["memory_limit"])
+    )
+    print("  jobs per dependency build: %d" % parallelism["inner"])
+    print("  jobs per CPython build: %d" % parallelism["cpython"])
+    print(
+        "  scheduled dependency build jobs: %d of %d CPUs"
+        % (parallelism["outer"] * parallelism["inner"], parallelism["cpu_count"])
+    )
+
+
+def read_trace(path):
+    """Read events from a trace file written by build steps."""
+    with open(path, encoding="utf-8") as fh:
+        data = fh.read().rstrip().rstrip(",")
+
+    if not data.endswith("]"):
+        data += "]"
+
+    return json.loads(data)
+
+
+def critical_path(events):
+    """Resolve the chain of build steps that determined the build's duration.
+
+    Starting from the step that finished last, we walk back through the
+    prerequisite that finished last until reaching a step without recorded
+    prerequisites.
+    """
+    actions = {}
+
+    for event in events:
+        if event.get("ph") != "X" or event.get("cat") != "action":
+            continue
+
+        dest_archive = event["args"].get("dest_archive")
+        if not dest_archive:
+            continue
+
+        # A step may be recorded multiple times if concurrent builds waited
+        # on each other. The longest one did the work.
+        if dest_archive not in actions or event["dur"] > actions[dest_archive]["dur"]:
+            actions[dest_archive] = event
+
+    if not actions:
+        return []
+
+    def end(event):
+        return event["ts"] + event["dur"]
+
+    current = max(actions.values(), key=end)
+    path = [current]
+
+    while True:
+        prerequisites = [
+            actions[p]
+            for p in current["args"].get("prerequisites", [])
+            if p in actions and actions[p] is not current
+        ]
+        if not prerequisites:
+            break
+
+        current = max(prerequisites, key=end)
+        path.append(current)
+
+    return list(reversed(path))
+
+
+def print_critical_path(trace_path):
+    """Print the critical path and per-operation timings of a traced build."""
+    events = read_trace(trace_path)
+
+    path = critical_path(events)
+    if not path:
+        print("no build steps recorded in %s" % trace_path)
+        return
+
+    origin = min(e["ts"] for e in events if "ts" in e)
+    finish = max(e["ts"] + e["dur"] for e in events if e.get("ph") == "X")
+
+    print("critical path (%.1fs total):" % ((finish - origin) / 1000000))
+    previous_end = origin
+    for event in path:
+        print(
+            "  %8.1fs %8.1fs (waited %6.1fs) %s %s"
+            % (
+                (event["ts"] - origin) / 1000000,
+                event["dur"] / 1000000,
+                max(0, event["ts"] - previous_end) / 1000000,
+                event["name"],
+                os.path.basename(event["args"]["dest_archive"]),
+            )
+        )
+        previous_end = event["ts"] + event["dur"]
+
+    operations = {}
+    for event in events:
+        if event.get("ph") != "X" or event.get("cat") == "action":
+            continue
+
+        o = operations.setdefault(event["name"], {"count": 0, "dur": 0, "bytes": 0})
+        o["count"] += 1
+        o["dur"] += event["dur"]
+        o["bytes"] += event["args"].get("bytes", 0)
+
+    if operations:
+        print("time spent by operation:")
+        for name, o in sorted(operations.items(), key=lambda x: -x[1]["dur"]):
+            print(
+                "  %10.1fs %5d calls %10.1f MiB %s"
+                % (o["dur"] / 1000000, o["count"], o["bytes"] / 1024**2, name)
+            )
+
+
 def add_env_common(env):
     """Adds extra keys to environment variables."""
 
-    cpu_count = multiprocessing.cpu_count()
+    # build-main.py sizes make parallelism inside each build so concurrent
+    # builds don't oversaturate the machine.
+    cpu_count = int(os.environ.get("PYBUILD_INNER_JOBS", available_cpu_count()))
     env["NUM_CPUS"] = "%d" % cpu_count
     env["NUM_JOBS_AGGRESSIVE"] = "%d" % max(cpu_count + 2, cpu_count * 2)
 
@@ -545,18 +2191,18 @@ def exec_and_log(args, cwd, env):
         args,
         cwd=cwd,
         env=env,
-        bufsize=1,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
     )
 
-    for line in iter(p.stdout.readline, b""):
-        log(line.rstrip())
+    for chunk in iter(lambda: p.stdout.read1(65536), b""):
+        log_output(chunk)
 
     p.wait()
 
     if p.returncode:
         if "PYBUILD_BREAK_ON_FAILURE" in os.environ:
+            flush_log()
             import pdb
 
             pdb.set_trace()
@@ -4,9 +4,8 @@
 
 use std::str::FromStr;
 
-use crate::release::{bootstrap_llvm, produce_install_only_stripped};
 use {
-    crate::release::{produce_install_only, RELEASE_TRIPLES},
+    crate::release::RELEASE_TRIPLES,
     anyhow::{anyhow, Result},
     bytes::Bytes,
     clap::ArgMatches,
@@ -16,12 +15,11 @@ use {
         params::actions::ArchiveFormat,
         Octocrab, OctocrabBuilder,
     },
-    rayon::prelude::*,
     sha2::{Digest, Sha256},
     std::{
         collections::{BTreeMap, BTreeSet, HashMap},
-        io::Read,
-        path::PathBuf,
+        io::{Read, Seek},
+        path::{Path, PathBuf},
     },
     url::Url,
     zip::ZipArchive,
@@ -43,6 +41,34 @@ async fn fetch_artifact(
     Ok(res)
 }
 
+/// Extract a distribution from a CI artifact into `dest_dir`.
+///
+/// The `.sha256` and `.json` files written next to it when it was compressed
+/// are extracted along with it so releasing doesn't need to hash it again.
+fn extract_distribution<R: Read + Seek>(
+    za: &mut ZipArchive<R>,
+    name: &str,
+    dest_dir: &Path,
+) -> Result<()> {
+    for filename in [
+        name.to_string(),
+        format!("{name}.sha256"),
+        format!("{name}.json"),
+    ] {
+        let mut zf = za
+            .by_name(&filename)
+            .map_err(|_| anyhow!("{filename} not found in build artifact"))?;
+
+        let mut buf = vec![];
+        zf.read_to_end(&mut buf)?;
+        std::fs::write(dest_dir.join(&filename), &buf)?;
+    }
+
+    println!("prepared {} for release", name);
+
+    Ok(())
+}
+
 async fn upload_release_artifact(
     auth_token: String,
     release: &Release,
@@ -199,16 +225,24 @@ pub async fn command_fetch_release_distributions(args: &ArgMatches) -> Result<()
 
     let mut buffered = futures::stream::iter(fs).buffer_unordered(24);
 
-    let mut install_paths = vec![];
-
     while let Some(res) = buffered.next().await {
         let data = res?;
 
         let mut za = ZipArchive::new(std::io::Cursor::new(data))?;
+
+        // The `install_only` archives are produced alongside the full archive of every
+        // build. Their names don't include the build options, so we only know whether to
+        // release them once we've seen the full archive of the same build.
+        let mut install_only_indices = vec![];
+        let mut is_install_only_build = false;
+
         for i in 0..za.len() {
-            let mut zf = za.by_index(i)?;
+            let name = za.by_index(i)?.name().to_string();
 
-            let name = zf.name().to_string();
+            // Checksum files are extracted along with the distribution they describe.
+            if name.ends_with(".sha256") || name.ends_with(".json") {
+                continue;
+            }
 
             let parts = name.split('-').collect::<Vec<_>>();
 
@@ -244,6 +278,11 @@ pub async fn command_fetch_release_distributions(args: &ArgMatches) -> Result<()
                 continue;
             };
 
+            if name.ends_with(".tar.gz") {
+                install_only_indices.push(i);
+                continue;
+            }
+
             let stripped_name = if let Some(s) = name.strip_suffix(".tar.zst") {
                 s
             } else {
@@ -264,63 +303,41 @@ pub async fn command_fetch_release_distributions(args: &ArgMatches) -> Result<()
                 continue;
             }
 
-            let dest_path = dest_dir.join(&name);
-            let mut buf = vec![];
-            zf.read_to_end(&mut buf)?;
-            std::fs::write(&dest_path, &buf)?;
-
-            println!("prepared {} for release", name);
+            extract_distribution(&mut za, &name, dest_dir)?;
 
             if build_suffix == release.install_only_suffix {
-                install_paths.push(dest_path);
+                is_install_only_build = true;
             }
         }
-    }
 
-    let llvm_dir = bootstrap_llvm().await?;
-
-    install_paths
-        .par_iter()
-        .try_for_each(|path| -> Result<()> {
-            // Create the `install_only` archive.
-            println!(
-                "producing install_only archive from {}",
-                path.file_name()
-                    .expect("should have file name")
-                    .to_string_lossy()
-            );
+        if !is_install_only_build {
+            continue;
+        }
 
-            let dest_path = produce_install_only(path)?;
+        let mut flavors = BTreeSet::new();
 
-            println!(
-                "prepared {} for release",
-                dest_path
-                    .file_name()
-                    .expect("should have file name")
-                    .to_string_lossy()
-            );
+        for i in install_only_indices {
+            let name = za.by_index(i)?.name().to_string();
 
-            // Create the `install_only_stripped` archive.
-            println!(
-                "producing install_only_stripped archive from {}",
-                dest_path
-                    .file_name()
-                    .expect("should have file name")
-                    .to_string_lossy()
-            );
+            let parts = name.split('-').collect::<Vec<_>>();
+            let flavor = parts[parts.len() - 2];
+
+            if !matches!(flavor, "install_only" | "install_only_stripped") {
+                println!("ignoring {} not an install_only artifact", name);
+                continue;
+            }
 
-            let dest_path = produce_install_only_stripped(&dest_path, &llvm_dir)?;
+            extract_distribution(&mut za, &name, dest_dir)?;
 
-            println!(
-                "prepared {} for release",
-                dest_path
-                    .file_name()
-                    .expect("should have file name")
-                    .to_string_lossy()
-            );
+            flavors.insert(flavor.to_string());
+        }
 
-            Ok(())
-        })?;
+        if flavors.len() != 2 {
+            return Err(anyhow!(
+                "install_only build artifact is missing install_only archives; was it built with --install-only?"
+            ));
+        }
+    }
 
     Ok(())
 }
@@ -459,10 +476,19 @@ pub async fn command_upload_release_distributions(args: &ArgMatches) -> Result<(
 
         let file_data = Bytes::copy_from_slice(&std::fs::read(dist_dir.join(&source))?);
 
-        let mut digest = Sha256::new();
-        digest.update(&file_data);
+        // The digest was recorded when the distribution was compressed. Check that what
+        // we're about to upload still matches it.
+        let digest = std::fs::read_to_string(dist_dir.join(format!("{}.sha256", source)))
+            .map_err(|e| anyhow!("unable to read digest of {}: {}", source, e))?
+            .trim_end()
+            .to_string();
 
-        let digest = hex::encode(digest.finalize());
+        let mut actual = Sha256::new();
+        actual.update(&file_data);
+
+        if hex::encode(actual.finalize()) != digest {
+            return Err(anyhow!("{} does not match its recorded SHA256", source));
+        }
 
         digests.insert(dest.clone(), digest.clone());
 
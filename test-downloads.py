@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Script to exercise resumable downloads against a misbehaving local server."""
+
+import hashlib
+import http.server
+import os
+import pathlib
+import sys
+import tempfile
+import threading
+
+ROOT = pathlib.Path(os.path.abspath(__file__)).parent
+sys.path.insert(0, str(ROOT))
+
+from pythonbuild.utils import fetch_url_to_path  # noqa: E402
+
+CONTENT = os.urandom(1024 * 1024)
+SHA256 = hashlib.sha256(CONTENT).hexdigest()
+HALF = len(CONTENT) // 2
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    """Serves ``CONTENT``, misbehaving as instructed by the server.
+
+    Each request consumes the next behavior of ``server.behaviors``:
+
+    ``range``
+       Honor Range requests.
+    ``drop``
+       Honor Range requests, but close the connection halfway through.
+    ``ignore-range``
+       Always send the whole content with a 200.
+    ``bad-range``
+       Answer Range requests with content starting at the wrong offset.
+    """
+
+    def do_GET(self):
+        requested = self.headers.get("Range")
+        self.server.requests.append(requested)
+
+        behavior = self.server.behaviors.pop(0)
+
+        start = 0
+        if requested and behavior != "ignore-range":
+            start = int(requested[len("bytes=") : -1])
+
+            if behavior == "bad-range":
+                start += 1
+
+        data = CONTENT[start:]
+
+        self.send_response(206 if start else 200)
+        self.send_header("Content-Length", "%d" % len(data))
+        if start:
+            self.send_header(
+                "Content-Range",
+                "bytes %d-%d/%d" % (start, len(CONTENT) - 1, len(CONTENT)),
+            )
+        self.end_headers()
+
+        if behavior == "drop":
+            data = data[: len(data) // 2]
+
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+# Name, behaviors of consecutive requests, existing partial download, and the
+# Range headers the server is expected to receive.
+SCENARIOS = [
+    ("fresh", ["range"], None, [None]),
+    ("connection dropped", ["drop", "range"], None, [None, "bytes=%d-" % HALF]),
+    ("resumed", ["range"], CONTENT[:HALF], ["bytes=%d-" % HALF]),
+    ("range ignored", ["ignore-range"], CONTENT[:HALF], ["bytes=%d-" % HALF]),
+    (
+        "bad Content-Range",
+        ["bad-range", "range"],
+        CONTENT[:HALF],
+        ["bytes=%d-" % HALF, None],
+    ),
+    ("corrupt partial", ["range", "range"], b"\0" * HALF, ["bytes=%d-" % HALF, None]),
+    ("complete partial", [], CONTENT, []),
+    ("complete corrupt partial", ["range"], b"\0" * len(CONTENT), [None]),
+]
+
+
+def run_scenario(server, td: pathlib.Path, behaviors, partial):
+    path = td / "download"
+    part = td / "download.part"
+
+    for p in (path, part):
+        if p.exists():
+            p.unlink()
+
+    if partial is not None:
+        part.write_bytes(partial)
+
+    server.behaviors = list(behaviors)
+    server.requests = []
+
+    fetch_url_to_path(
+        "http://127.0.0.1:%d/download" % server.server_address[1],
+        path,
+        len(CONTENT),
+        SHA256,
+    )
+
+    if path.read_bytes() != CONTENT:
+        raise Exception("downloaded content doesn't match")
+
+    if part.exists():
+        raise Exception("partial download left behind")
+
+    return server.requests
+
+
+def main():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+
+    failures = 0
+
+    try:
+        with tempfile.TemporaryDirectory() as td:
+            for name, behaviors, partial, expected in SCENARIOS:
+                try:
+                    requests = run_scenario(
+                        server, pathlib.Path(td), behaviors, partial
+                    )
+                    if requests != expected:
+                        raise Exception(
+                            "expected requests %r; got %r" % (expected, requests)
+                        )
+                except Exception as e:
+                    print("FAIL: %s: %s" % (name, e))
+                    failures += 1
+                else:
+                    print("ok: %s" % name)
+    finally:
+        server.shutdown()
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,8 @@
+from .api import APIClient
+from .client import DockerClient, from_env
+from .context import Context
+from .context import ContextAPI
+from .tls import TLSConfig
+from .version import __version__
+
+__title__ = 'docker'
@@ -0,0 +1,2 @@
+from .context import Context
+from .api import ContextAPI
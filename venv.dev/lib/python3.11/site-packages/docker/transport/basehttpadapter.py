@@ -0,0 +1,8 @@
+import requests.adapters
+
+
+class BaseHTTPAdapter(requests.adapters.HTTPAdapter):
+    def close(self):
+        super().close()
+        if hasattr(self, 'pools'):
+            self.pools.clear()
@@ -0,0 +1,13 @@
+from .containers import (
+    ContainerConfig, HostConfig, LogConfig, Ulimit, DeviceRequest
+)
+from .daemon import CancellableStream
+from .healthcheck import Healthcheck
+from .networks import EndpointConfig, IPAMConfig, IPAMPool, NetworkingConfig
+from .services import (
+    ConfigReference, ContainerSpec, DNSConfig, DriverConfig, EndpointSpec,
+    Mount, Placement, PlacementPreference, Privileges, Resources,
+    RestartPolicy, RollbackConfig, SecretReference, ServiceMode, TaskTemplate,
+    UpdateConfig, NetworkAttachmentConfig
+)
+from .swarm import SwarmSpec, SwarmExternalCA
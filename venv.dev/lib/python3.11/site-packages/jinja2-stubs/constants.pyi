@@ -0,0 +1 @@
+LOREM_IPSUM_WORDS: str
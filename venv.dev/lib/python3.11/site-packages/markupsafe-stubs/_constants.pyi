@@ -0,0 +1,3 @@
+from typing import Text
+
+HTML_ENTITIES: dict[Text, int]
@@ -0,0 +1 @@
+# This page intentionally left blank
@@ -0,0 +1 @@
+def getpreferredencoding(do_setlocale: bool = True) -> str: ...
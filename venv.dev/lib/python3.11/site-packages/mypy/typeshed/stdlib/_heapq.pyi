@@ -0,0 +1,12 @@
+from typing import Any, TypeVar
+from typing_extensions import Final
+
+_T = TypeVar("_T")
+
+__about__: Final[str]
+
+def heapify(__heap: list[Any]) -> None: ...
+def heappop(__heap: list[_T]) -> _T: ...
+def heappush(__heap: list[_T], __item: _T) -> None: ...
+def heappushpop(__heap: list[_T], __item: _T) -> _T: ...
+def heapreplace(__heap: list[_T], __item: _T) -> _T: ...
@@ -0,0 +1,141 @@
+import sys
+import types
+from collections.abc import Callable, Iterator
+from opcode import *  # `dis` re-exports it as a part of public API
+from typing import IO, Any, NamedTuple
+from typing_extensions import Self, TypeAlias
+
+__all__ = [
+    "code_info",
+    "dis",
+    "disassemble",
+    "distb",
+    "disco",
+    "findlinestarts",
+    "findlabels",
+    "show_code",
+    "get_instructions",
+    "Instruction",
+    "Bytecode",
+    "cmp_op",
+    "hasconst",
+    "hasname",
+    "hasjrel",
+    "hasjabs",
+    "haslocal",
+    "hascompare",
+    "hasfree",
+    "opname",
+    "opmap",
+    "HAVE_ARGUMENT",
+    "EXTENDED_ARG",
+    "stack_effect",
+]
+if sys.version_info >= (3, 12):
+    __all__ += ["hasarg", "hasexc"]
+else:
+    __all__ += ["hasnargs"]
+
+# Strictly this should not have to include Callable, but mypy doesn't use FunctionType
+# for functions (python/mypy#3171)
+_HaveCodeType: TypeAlias = types.MethodType | types.FunctionType | types.CodeType | type | Callable[..., Any]
+
+if sys.version_info >= (3, 11):
+    class Positions(NamedTuple):
+        lineno: int | None = None
+        end_lineno: int | None = None
+        col_offset: int | None = None
+        end_col_offset: int | None = None
+
+if sys.version_info >= (3, 11):
+    class Instruction(NamedTuple):
+        opname: str
+        opcode: int
+        arg: int | None
+        argval: Any
+        argrepr: str
+        offset: int
+        starts_line: int | None
+        is_jump_target: bool
+        positions: Positions | None = None
+
+else:
+    class Instruction(NamedTuple):
+        opname: str
+        opcode: int
+        arg: int | None
+        argval: Any
+        argrepr: str
+        offset: int
+        starts_line: int | None
+        is_jump_target: bool
+
+class Bytecode:
+    codeobj: types.CodeType
+    first_line: int
+    if sys.version_info >= (3, 11):
+        def __init__(
+            self,
+            x: _HaveCodeType | str,
+            *,
+            first_line: int | None = None,
+            current_offset: int | None = None,
+            show_caches: bool = False,
+            adaptive: bool = False,
+        ) -> None: ...
+        @classmethod
+        def from_traceback(cls, tb: types.TracebackType, *, show_caches: bool = False, adaptive: bool = False) -> Self: ...
+    else:
+        def __init__(
+            self, x: _HaveCodeType | str, *, first_line: int | None = None, current_offset: int | None = None
+        ) -> None: ...
+        @classmethod
+        def from_traceback(cls, tb: types.TracebackType) -> Self: ...
+
+    def __iter__(self) -> Iterator[Instruction]: ...
+    def info(self) -> str: ...
+    def dis(self) -> str: ...
+
+COMPILER_FLAG_NAMES: dict[int, str]
+
+def findlabels(code: _HaveCodeType) -> list[int]: ...
+def findlinestarts(code: _HaveCodeType) -> Iterator[tuple[int, int]]: ...
+def pretty_flags(flags: int) -> str: ...
+def code_info(x: _HaveCodeType | str) -> str: ...
+
+if sys.version_info >= (3, 11):
+    def dis(
+        x: _HaveCodeType | str | bytes | bytearray | None = None,
+        *,
+        file: IO[str] | None = None,
+        depth: int | None = None,
+        show_caches: bool = False,
+        adaptive: bool = False,
+    ) -> None: ...
+
+else:
+    def dis(
+        x: _HaveCodeType | str | bytes | bytearray | None = None, *, file: IO[str] | None = None, depth: int | None = None
+    ) -> None: ...
+
+if sys.version_info >= (3, 11):
+    def disassemble(
+        co: _HaveCodeType, lasti: int = -1, *, file: IO[str] | None = None, show_caches: bool = False, adaptive: bool = False
+    ) -> None: ...
+    def disco(
+        co: _HaveCodeType, lasti: int = -1, *, file: IO[str] | None = None, show_caches: bool = False, adaptive: bool = False
+    ) -> None: ...
+    def distb(
+        tb: types.TracebackType | None = None, *, file: IO[str] | None = None, show_caches: bool = False, adaptive: bool = False
+    ) -> None: ...
+    def get_instructions(
+        x: _HaveCodeType, *, first_line: int | None = None, show_caches: bool = False, adaptive: bool = False
+    ) -> Iterator[Instruction]: ...
+
+else:
+    def disassemble(co: _HaveCodeType, lasti: int = -1, *, file: IO[str] | None = None) -> None: ...
+    def disco(co: _HaveCodeType, lasti: int = -1, *, file: IO[str] | None = None) -> None: ...
+    def distb(tb: types.TracebackType | None = None, *, file: IO[str] | None = None) -> None: ...
+    def get_instructions(x: _HaveCodeType, *, first_line: int | None = None) -> Iterator[Instruction]: ...
+
+def show_code(co: _HaveCodeType, *, file: IO[str] | None = None) -> None: ...
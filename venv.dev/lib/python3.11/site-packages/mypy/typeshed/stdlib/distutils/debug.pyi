@@ -0,0 +1 @@
+DEBUG: bool | None
@@ -0,0 +1,2 @@
+def spawn(cmd: list[str], search_path: bool = ..., verbose: bool = ..., dry_run: bool = ...) -> None: ...
+def find_executable(executable: str, path: str | None = None) -> str | None: ...
@@ -0,0 +1,2 @@
+from _dummy_threading import *
+from _dummy_threading import __all__ as __all__
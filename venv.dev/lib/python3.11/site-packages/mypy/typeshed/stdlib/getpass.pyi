@@ -0,0 +1,8 @@
+from typing import TextIO
+
+__all__ = ["getpass", "getuser", "GetPassWarning"]
+
+def getpass(prompt: str = "Password: ", stream: TextIO | None = None) -> str: ...
+def getuser() -> str: ...
+
+class GetPassWarning(UserWarning): ...
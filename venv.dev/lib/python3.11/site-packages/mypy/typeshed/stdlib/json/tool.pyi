@@ -0,0 +1 @@
+def main() -> None: ...
@@ -0,0 +1,10 @@
+from typing import ClassVar
+from typing_extensions import Literal
+
+from .. import fixer_base
+
+class FixIntern(fixer_base.BaseFix):
+    BM_compatible: ClassVar[Literal[True]]
+    order: ClassVar[Literal["pre"]]
+    PATTERN: ClassVar[str]
+    def transform(self, node, results): ...
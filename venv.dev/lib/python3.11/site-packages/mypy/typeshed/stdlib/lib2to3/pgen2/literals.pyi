@@ -0,0 +1,7 @@
+from re import Match
+
+simple_escapes: dict[str, str]
+
+def escape(m: Match[str]) -> str: ...
+def evalString(s: str) -> str: ...
+def test() -> None: ...
@@ -0,0 +1,2 @@
+def url2pathname(url: str) -> str: ...
+def pathname2url(p: str) -> str: ...
@@ -0,0 +1,8 @@
+import sys
+
+if sys.platform == "win32":
+    from ntpath import *
+    from ntpath import __all__ as __all__
+else:
+    from posixpath import *
+    from posixpath import __all__ as __all__
@@ -0,0 +1 @@
+topics: dict[str, str]
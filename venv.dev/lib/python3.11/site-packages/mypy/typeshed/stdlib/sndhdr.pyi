@@ -0,0 +1,14 @@
+from _typeshed import StrOrBytesPath
+from typing import NamedTuple
+
+__all__ = ["what", "whathdr"]
+
+class SndHeaders(NamedTuple):
+    filetype: str
+    framerate: int
+    nchannels: int
+    nframes: int
+    sampwidth: int | str
+
+def what(filename: StrOrBytesPath) -> SndHeaders | None: ...
+def whathdr(filename: StrOrBytesPath) -> SndHeaders | None: ...
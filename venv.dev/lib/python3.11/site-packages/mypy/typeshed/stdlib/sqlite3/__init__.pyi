@@ -0,0 +1 @@
+from sqlite3.dbapi2 import *
@@ -0,0 +1 @@
+from _stat import *
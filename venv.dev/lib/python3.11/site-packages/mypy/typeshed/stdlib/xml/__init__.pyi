@@ -0,0 +1 @@
+from xml import parsers as parsers
@@ -0,0 +1,8 @@
+from _typeshed.xml import DOMImplementation
+from collections.abc import Callable, Iterable
+
+well_known_implementations: dict[str, str]
+registered: dict[str, Callable[[], DOMImplementation]]
+
+def registerDOMImplementation(name: str, factory: Callable[[], DOMImplementation]) -> None: ...
+def getDOMImplementation(name: str | None = None, features: str | Iterable[tuple[str, str | None]] = ()) -> DOMImplementation: ...
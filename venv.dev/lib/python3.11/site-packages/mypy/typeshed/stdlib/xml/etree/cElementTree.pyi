@@ -0,0 +1 @@
+from xml.etree.ElementTree import *
@@ -0,0 +1 @@
+from xml.parsers import expat as expat
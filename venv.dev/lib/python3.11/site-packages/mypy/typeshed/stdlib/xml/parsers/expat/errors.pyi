@@ -0,0 +1 @@
+from pyexpat.errors import *
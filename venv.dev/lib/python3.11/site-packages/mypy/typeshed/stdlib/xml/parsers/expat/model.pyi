@@ -0,0 +1 @@
+from pyexpat.model import *
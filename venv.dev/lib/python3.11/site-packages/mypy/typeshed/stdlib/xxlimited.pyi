@@ -0,0 +1,23 @@
+import sys
+from typing import Any
+from typing_extensions import final
+
+class Str: ...
+
+@final
+class Xxo:
+    def demo(self) -> None: ...
+    if sys.version_info >= (3, 11) and sys.platform != "win32":
+        x_exports: int
+
+def foo(__i: int, __j: int) -> Any: ...
+def new() -> Xxo: ...
+
+if sys.version_info >= (3, 10):
+    class Error: ...
+
+else:
+    class error: ...
+    class Null: ...
+
+    def roj(__b: Any) -> None: ...